@@ -4,13 +4,31 @@ Handles debounced saving, focus-out saves, and entry lifecycle.
 """
 
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional, Callable
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QCoreApplication, QObject, QTimer, Signal, Slot
 from PySide6.QtWidgets import QTextEdit
 
 from ..data.entry_manager import Entry, EntryManager
 from ..settings import get_setting
+from ..utils.file_utils import write_text_atomic
+
+# Autosaves hand the file write to one background thread, so slow disks never
+# stall typing; a single worker keeps writes in submission order
+_entry_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="entry-writer")
+
+# Documents longer than this many characters skip the per-keystroke content sync
+_LIVE_SYNC_CHAR_LIMIT = 50000
+
+# Large documents wait longer between autosaves (1 ms per 1000 characters),
+# up to this cap; continuous typing is still saved at least this often
+_MAX_DEBOUNCE_MS = 5000
+_MAX_UNSAVED_SECONDS = 10
+
+# Debounced autosaves start at least this far apart, so short pauses between
+# bursts of typing don't each write the file (explicit saves aren't limited)
+_MIN_AUTOSAVE_GAP_SECONDS = 2
 
 
 class AutosaveManager(QObject):
@@ -20,6 +38,7 @@ class AutosaveManager(QObject):
     save_started = Signal()
     save_completed = Signal(bool)  # success
     entry_created = Signal(Entry)  # when new entry is instantiated
+    _write_finished = Signal()     # background write done (queued to GUI thread)
     
     def __init__(self, text_editor: QTextEdit, parent=None):
         """Initialize autosave manager."""
@@ -36,15 +55,26 @@ class AutosaveManager(QObject):
         # Timers
         self.debounce_timer = QTimer()
         self.debounce_timer.setSingleShot(True)
-        self.debounce_timer.timeout.connect(self._perform_autosave)
+        self.debounce_timer.timeout.connect(self._on_debounce_timeout)
+        self._save_deadline = 0.0  # time.monotonic() at which to autosave
+        self._burst_started = 0.0  # time.monotonic() of the first unsaved edit
+        self._last_autosave = 0.0  # time.monotonic() of the last debounced save
         
         # State tracking
         self.is_saving = False
+        self._pending_write = None  # (future, entry, saved content)
+        self._write_finished.connect(self._finish_pending_write)
         self.has_unsaved_changes = False
         self.first_keypress_handled = False
+        self._loading = False  # True while load_entry() fills the editor
         
         # Connect text editor signals
         self._connect_editor_signals()
+        
+        # Flush a pending edit on exit, whichever way the app quits
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.save_and_close)
     
     def _connect_editor_signals(self):
         """Connect text editor signals for autosave."""
@@ -61,22 +91,52 @@ class AutosaveManager(QObject):
             original_focus_out(event)
         return wrapped_focus_out
     
+    @Slot()
     def _on_text_changed(self):
         """Handle text changes in editor."""
-        # Check for first keypress on new entry
-        if not self.first_keypress_handled and self.text_editor.toPlainText().strip():
+        # Text put in the editor by load_entry() is already on disk
+        if self._loading:
+            return
+        
+        # Check for first keypress on new entry (an empty document can't be
+        # one, so skip copying the text out)
+        document = self.text_editor.document()
+        if (not self.first_keypress_handled and not document.isEmpty()
+                and self.text_editor.toPlainText().strip()):
             self._handle_first_keypress()
         
         # Mark as having unsaved changes
         self.has_unsaved_changes = True
         
-        # Update current entry content
-        if self.current_entry:
+        # Update current entry content; large documents are synced when they
+        # are saved instead of copied out on every keystroke
+        if self.current_entry and document.characterCount() <= _LIVE_SYNC_CHAR_LIMIT:
             self.current_entry.content = self.text_editor.toPlainText()
         
-        # Start/restart debounce timer
-        self.debounce_timer.stop()
-        self.debounce_timer.start(self.debounce_ms)
+        # Push the save deadline back, but never past the unsaved-edit limit;
+        # the running timer re-arms itself for the remainder when it fires,
+        # so keystrokes never restart it
+        now = time.monotonic()
+        interval_ms = min(_MAX_DEBOUNCE_MS,
+                          max(self.debounce_ms, document.characterCount() // 1000))
+        if not self.debounce_timer.isActive():
+            self._burst_started = now
+            self.debounce_timer.start(interval_ms)
+        self._save_deadline = min(now + interval_ms / 1000,
+                                  self._burst_started + _MAX_UNSAVED_SECONDS)
+    
+    @Slot()
+    def _on_debounce_timeout(self):
+        """Autosave once the text has been idle for the debounce interval."""
+        now = time.monotonic()
+        due = max(self._save_deadline, self._last_autosave + _MIN_AUTOSAVE_GAP_SECONDS)
+        remaining_ms = int((due - now) * 1000)
+        if remaining_ms > 0:
+            self.debounce_timer.start(remaining_ms)
+            return
+        
+        self._last_autosave = now
+        self._perform_autosave()
     
     def _handle_first_keypress(self):
         """Handle first keypress of new note - instantiate entry."""
@@ -105,6 +165,10 @@ class AutosaveManager(QObject):
         if not self.current_entry:
             return
         
+        # Let an autosave still being written land first; otherwise this save
+        # is skipped as already in progress and later edits never reach disk
+        self._finish_pending_write()
+        
         # Cancel debounce timer
         self.debounce_timer.stop()
         self._save_current_entry()
@@ -114,30 +178,70 @@ class AutosaveManager(QObject):
         if self.is_saving or not self.current_entry:
             return
         
+        entry = self.current_entry
+        
+        # Edits that cancel out (e.g. space then backspace) leave nothing to write
+        entry.content = self.text_editor.toPlainText()
+        if not entry.is_new and not entry.is_modified:
+            self.has_unsaved_changes = False
+            return
+        
         self.is_saving = True
         self.save_started.emit()
         
         try:
-            # Update entry content
-            self.current_entry.content = self.text_editor.toPlainText()
-            
-            # Save entry
-            success = self.entry_manager.save_entry(self.current_entry)
-            
-            if success:
-                self.has_unsaved_changes = False
-                print(f"Entry saved: {self.current_entry.metadata.path}")
-            else:
-                print("Failed to save entry")
-            
-            self.save_completed.emit(success)
-            
+            # Render here; only the file write leaves the GUI thread
+            content = entry.content
+            file_path, markdown_content = self.entry_manager.render_entry(entry)
         except Exception as e:
             print(f"Error during autosave: {e}")
+            self.is_saving = False
             self.save_completed.emit(False)
+            return
         
-        finally:
-            self.is_saving = False
+        future = _entry_writer.submit(write_text_atomic, file_path, markdown_content)
+        self._pending_write = (future, entry, content)
+        future.add_done_callback(self._on_write_done)
+    
+    def _on_write_done(self, future: Future):
+        """Hand a finished background write back to the GUI thread."""
+        try:
+            self._write_finished.emit()
+        except RuntimeError:
+            pass  # Manager already deleted
+    
+    def _finish_pending_write(self):
+        """Apply the result of the background write, if one is pending."""
+        if self._pending_write is None:
+            return
+        
+        future, entry, content = self._pending_write
+        self._pending_write = None
+        self.is_saving = False
+        
+        try:
+            future.result()
+            success = True
+        except Exception as e:
+            print(f"Error during autosave: {e}")
+            success = False
+        
+        if success:
+            self.entry_manager.mark_saved(entry, content)
+            if entry is self.current_entry:
+                # Large documents don't sync on every keystroke, so pick up
+                # edits typed during the write before comparing
+                self.sync_content()
+                self.has_unsaved_changes = entry.is_modified
+            print(f"Entry saved: {entry.metadata.path}")
+        
+        self.save_completed.emit(success)
+        
+        # Edits made while the write was in flight still need their own save
+        if self.has_unsaved_changes and not self.debounce_timer.isActive():
+            self._burst_started = time.monotonic()
+            self._save_deadline = self._burst_started + self.debounce_ms / 1000
+            self.debounce_timer.start(self.debounce_ms)
     
     def create_new_entry(self, content: str = ""):
         """Create new entry and reset autosave state."""
@@ -171,8 +275,13 @@ class AutosaveManager(QObject):
         
         self.current_entry = entry
         
-        # Update text editor
-        self.text_editor.setPlainText(entry.content)
+        # Update text editor; formatting and title extraction still see the
+        # change, but it doesn't mark the entry dirty or arm the timer
+        self._loading = True
+        try:
+            self.text_editor.setPlainText(entry.content)
+        finally:
+            self._loading = False
         
         # Reset state
         self.has_unsaved_changes = False
@@ -188,6 +297,10 @@ class AutosaveManager(QObject):
         
         self.debounce_timer.stop()
         
+        # Let an autosave still being written land first, so it can't
+        # overwrite this save with older content
+        self._finish_pending_write()
+        
         # Update content
         self.current_entry.content = self.text_editor.toPlainText()
         
@@ -201,10 +314,27 @@ class AutosaveManager(QObject):
     
     def save_and_close(self) -> bool:
         """Save current entry before app close."""
-        if self.current_entry and (self.has_unsaved_changes or self.current_entry.is_new):
+        if not self.current_entry:
+            return True
+        
+        # An autosave that just fired may still be writing this text; let it
+        # land so the check below doesn't write the same content twice
+        self._finish_pending_write()
+        
+        self.current_entry.content = self.text_editor.toPlainText()
+        if self.current_entry.is_modified or self.current_entry.is_new:
             return self.force_save()
+        
+        # Nothing new to write, so the pending autosave has nothing to do
+        self.debounce_timer.stop()
+        self.has_unsaved_changes = False
         return True
     
+    def sync_content(self):
+        """Copy the editor text into the current entry."""
+        if self.current_entry:
+            self.current_entry.content = self.text_editor.toPlainText()
+    
     def get_current_entry_info(self) -> dict:
         """Get current entry information for UI display."""
         if not self.current_entry:
@@ -12,6 +12,30 @@ from PySide6.QtWidgets import QTextEdit
 
 from ..settings import get_setting, set_setting
 
+# Whitespace following sentence-ending punctuation
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _leading_sentences(text: str, count: int) -> List[str]:
+    """Return up to ``count`` leading non-empty sentences of text.
+    
+    Stops scanning once enough sentences are found, so only the start of a
+    long entry is examined.
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_BREAK_RE.finditer(text):
+        sentence = text[start:match.start()].strip()
+        if sentence:
+            sentences.append(sentence)
+            if len(sentences) == count:
+                return sentences
+        start = match.end()
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
 
 @dataclass
 class FormatRule:
@@ -125,30 +149,22 @@ class SmartFormatter(QObject):
     
     def parse_title_subtitle(self, text: str) -> Tuple[str, str]:
         """Parse first two sentences for title and subtitle."""
-        if not text.strip():
+        if not text or text.isspace():
             return "", ""
         
         # Handle markdown headers specially
-        lines = text.split('\n')
-        first_line = lines[0].strip()
+        first_line, _, remaining_text = text.partition('\n')
+        first_line = first_line.strip()
         
         # Check if first line is a markdown header
         if first_line.startswith('#'):
             title = re.sub(r'^#+\s*', '', first_line).strip()
-            # Look for subtitle in remaining content
-            remaining_text = '\n'.join(lines[1:]).strip()
-            if remaining_text:
-                # Split remaining text into sentences (preserve punctuation)
-                sentences = re.split(r'(?<=[.!?])\s+', remaining_text)
-                sentences = [s.strip() for s in sentences if s.strip()]
-                subtitle = sentences[0][:200] if sentences else ""
-            else:
-                subtitle = ""
+            # Look for subtitle in remaining content (preserve punctuation)
+            sentences = _leading_sentences(remaining_text, 1)
+            subtitle = sentences[0][:200] if sentences else ""
         else:
             # No markdown header, split by sentences (preserve punctuation)
-            clean_text = text.strip()
-            sentences = re.split(r'(?<=[.!?])\s+', clean_text)
-            sentences = [s.strip() for s in sentences if s.strip()]
+            sentences = _leading_sentences(text, 2)
             
             title = sentences[0][:100] if sentences else ""
             subtitle = sentences[1][:200] if len(sentences) >= 2 else ""
@@ -161,7 +177,11 @@ class SmartFormatter(QObject):
         if self._formatting_in_progress:
             return
             
-        current_text = self.text_editor.toPlainText()
+        # An empty document has nothing to parse or format
+        if self.text_editor.document().isEmpty():
+            current_text = ""
+        else:
+            current_text = self.text_editor.toPlainText()
         
         # Update title/subtitle
         self.title, self.subtitle = self.parse_title_subtitle(current_text)
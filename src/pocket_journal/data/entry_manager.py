@@ -9,10 +9,20 @@ import uuid
 import yaml
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 from ..settings import get_setting
-from ..utils.file_utils import ensure_directory_exists, sanitize_filename
+from ..utils.file_utils import ensure_directory_exists, sanitize_filename, write_text_atomic
+
+# A word is any run of non-whitespace, matching str.split()
+_WORD_RE = re.compile(r"\S+")
+
+
+def count_words(text: str) -> int:
+    """Count the words in text without building a list of them."""
+    if not text or text.isspace():
+        return 0
+    return sum(1 for _ in _WORD_RE.finditer(text))
 
 
 @dataclass
@@ -70,7 +80,7 @@ class Entry:
         self.metadata.updated_at = datetime.now(timezone.utc).isoformat()
         
         # Update word count
-        self.metadata.word_count = len(self.content.split()) if self.content.strip() else 0
+        self.metadata.word_count = count_words(self.content)
         
         # Extract title from first line if not set or if content changed
         if not self.metadata.title and self.content.strip():
@@ -212,38 +222,46 @@ class EntryManager:
             if not force and not entry.is_modified and not entry.is_new:
                 return True
             
-            # Update metadata
-            entry.update_metadata()
-            
-            # Get target directory
-            entry_dir = self._get_entry_directory(entry.metadata.created_at)
-            
-            # Generate filename if not set
-            if not entry.metadata.path:
-                filename = entry.generate_filename()
-                file_path = entry_dir / filename
-                entry.metadata.path = str(file_path)
-            else:
-                file_path = Path(entry.metadata.path)
-            
-            # Ensure target directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            content = entry.content
+            file_path, markdown_content = self.render_entry(entry)
             
             # Write file
-            markdown_content = entry.to_markdown()
-            file_path.write_text(markdown_content, encoding='utf-8')
-            
-            # Update tracking
-            entry._original_content = entry.content
-            entry._is_new = False
-            self._last_save_time = datetime.now()
+            write_text_atomic(file_path, markdown_content)
             
+            self.mark_saved(entry, content)
             return True
             
         except Exception as e:
             print(f"Error saving entry: {e}")
             return False
     
+    def render_entry(self, entry: Entry) -> Tuple[Path, str]:
+        """Update metadata and return the entry's file path and markdown."""
+        # Update metadata
+        entry.update_metadata()
+        
+        # Get target directory
+        entry_dir = self._get_entry_directory(entry.metadata.created_at)
+        
+        # Generate filename if not set
+        if not entry.metadata.path:
+            filename = entry.generate_filename()
+            file_path = entry_dir / filename
+            entry.metadata.path = str(file_path)
+        else:
+            file_path = Path(entry.metadata.path)
+        
+        # Ensure target directory exists
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        return file_path, entry.to_markdown()
+    
+    def mark_saved(self, entry: Entry, content: str):
+        """Record that ``content`` of the entry is now on disk."""
+        entry._original_content = content
+        entry._is_new = False
+        self._last_save_time = datetime.now()
+    
     def get_recent_entries(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get list of recent entries (metadata only)."""
         entries = []
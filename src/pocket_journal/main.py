@@ -5,37 +5,197 @@ This module contains the main application class and entry point function.
 """
 
 import sys
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from datetime import date
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Optional
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QVBoxLayout, QHBoxLayout, QWidget, 
     QMessageBox, QPushButton, QLineEdit
 )
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon, QAction, QShortcut, QKeySequence
 
 from .app_meta import APP_NAME, ORG_NAME, VERSION, get_app_title
+from .data.entry_manager import count_words
 from .settings import settings, get_setting
-from .ui.launcher_manager import LauncherManager
-from .ui.settings_dialog import show_settings_dialog
 from .ui.help_center import show_help_center
 
 logger = logging.getLogger(__name__)
 
+# Window icon (placeholder path), resolved once at import
+_ICON_PATH = Path(__file__).resolve().parents[2] / "assets" / "icon.ico"
+
+# Edits larger than this many characters recount the whole document
+_WORD_COUNT_SPAN_LIMIT = 512
+
+
+@lru_cache(maxsize=1)
+def _format_date(date_ordinal: int) -> str:
+    """Format the header date; keyed on the ordinal so it refreshes daily."""
+    return date.fromordinal(date_ordinal).strftime("%B %d, %Y")
+
+
+@lru_cache(maxsize=1)
+def _get_app_icon() -> Optional[QIcon]:
+    """Load the window icon once; QIcon needs a QApplication, so not at import."""
+    if _ICON_PATH.exists():
+        return QIcon(str(_ICON_PATH))
+    return None
+
+
+class _LazyFileHandler(logging.FileHandler):
+    """File handler that creates the log directory only when first opened."""
+    
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
 
 class PocketJournalMainWindow(QMainWindow):
     """Main window for the PocketJournal application."""
     
+    # Static window stylesheet; widgets are targeted by object name
+    _WINDOW_QSS = """
+        QMainWindow {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #2c3e50, stop:0.5 #34495e, stop:1 #2c3e50);
+            color: #ecf0f1;
+        }
+        QWidget {
+            font-family: 'Segoe UI', 'Helvetica Neue', Helvetica, Arial, sans-serif;
+        }
+        QWidget#header {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 rgba(52, 73, 94, 0.9), stop:1 rgba(44, 62, 80, 0.9));
+            border-bottom: 2px solid rgba(52, 152, 219, 0.3);
+        }
+        QLabel#dateLabel {
+            font-size: 18px;
+            font-weight: 600;
+            color: #ecf0f1;
+            background: transparent;
+            border: none;
+        }
+        QPushButton#newEntryButton {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #3498db, stop:1 #2980b9);
+            color: white;
+            border: none;
+            border-radius: 8px;
+            padding: 10px 18px;
+            font-size: 13px;
+            font-weight: 600;
+        }
+        QPushButton#newEntryButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #5dade2, stop:1 #3498db);
+        }
+        QPushButton#newEntryButton:pressed {
+            background: #2980b9;
+        }
+        QWidget#writingArea {
+            background: transparent;
+        }
+        QLineEdit#titleInput {
+            font-size: 24px;
+            font-weight: 600;
+            color: #ecf0f1;
+            background: rgba(52, 73, 94, 0.6);
+            border: none;
+            border-bottom: 3px solid rgba(52, 152, 219, 0.5);
+            border-radius: 8px;
+            padding: 15px;
+            margin-bottom: 20px;
+        }
+        QLineEdit#titleInput:focus {
+            border-bottom: 3px solid #3498db;
+            background: rgba(52, 73, 94, 0.8);
+            outline: none;
+        }
+        QPlainTextEdit#journalEditor {
+            font-size: 16px;
+            line-height: 1.6;
+            color: #ecf0f1;
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #34495e, stop:0.5 #2c3e50, stop:1 #34495e);
+            border: 2px solid rgba(52, 152, 219, 0.3);
+            padding: 25px;
+            border-radius: 12px;
+            selection-background-color: #3498db;
+            selection-color: white;
+        }
+        QPlainTextEdit#journalEditor:focus {
+            outline: none;
+            border: 2px solid #3498db;
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #2c3e50, stop:0.5 #34495e, stop:1 #2c3e50);
+        }
+        QPlainTextEdit#journalEditor QScrollBar:vertical {
+            background: rgba(255, 255, 255, 0.1);
+            border: none;
+            border-radius: 4px;
+            width: 12px;
+        }
+        QPlainTextEdit#journalEditor QScrollBar::handle:vertical {
+            background: rgba(52, 152, 219, 0.7);
+            border-radius: 6px;
+            min-height: 20px;
+        }
+        QPlainTextEdit#journalEditor QScrollBar::handle:vertical:hover {
+            background: rgba(52, 152, 219, 0.9);
+        }
+        QWidget#bottomBar {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 rgba(44, 62, 80, 0.9), stop:1 rgba(52, 73, 94, 0.9));
+            border-top: 2px solid rgba(52, 152, 219, 0.3);
+        }
+        QLabel#wordCountLabel {
+            font-size: 12px;
+            color: rgba(236, 240, 241, 0.7);
+            background: transparent;
+            border: none;
+        }
+        QPushButton#saveButton {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #27ae60, stop:1 #229954);
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 8px 16px;
+            font-size: 12px;
+            font-weight: bold;
+        }
+        QPushButton#saveButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #2ecc71, stop:1 #27ae60);
+        }
+        QPushButton#saveButton:pressed {
+            background: #229954;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
         self.launcher_manager = None
         self.help_center = None  # Store help center reference
+        self._show_about_dialog = None  # Resolved on first About request
+        self._minimize_on_expand = False
+        self._tray = None  # Current launcher tray, if in tray mode
+        self._wired_tray = None  # Tray whose signals are connected to us
+        self.refresh_cached_settings()
         self.init_ui()
-        self.setup_launcher()
         self.setup_menu()
-        self.setup_global_shortcuts()
+        # Build the launcher once the event loop runs so the window paints first
+        QTimer.singleShot(0, self.setup_launcher)
     
     def setup_launcher(self):
         """Setup the micro-launcher system."""
+        from .ui.launcher_manager import LauncherManager
+        
         self.launcher_manager = LauncherManager(self)
         
         # Connect launcher signals
@@ -44,16 +204,26 @@ class PocketJournalMainWindow(QMainWindow):
         self.launcher_manager.dock_mode_changed.connect(self.on_dock_mode_changed)
         
         # Connect tray signals (if in tray mode)
-        if hasattr(self.launcher_manager, 'system_tray') and self.launcher_manager.system_tray:
-            self.launcher_manager.system_tray.show_window_requested.connect(self.show_and_raise)
-            self.launcher_manager.system_tray.settings_requested.connect(self.show_settings)
-            self.launcher_manager.system_tray.about_requested.connect(self.show_about)
-            self.launcher_manager.system_tray.exit_requested.connect(self.close_application)
+        self._tray = getattr(self.launcher_manager, 'system_tray', None)
+        if self._tray is not None:
+            self._wire_tray_signals(self._tray)
+    
+    def _wire_tray_signals(self, tray):
+        """Connect tray signals to the window; repeated calls are no-ops."""
+        # Track the wired tray explicitly: PySide does not reliably honour
+        # UniqueConnection for Python callables.
+        if tray is self._wired_tray:
+            return
+        self._wired_tray = tray
+        tray.show_window_requested.connect(self.show_and_raise)
+        tray.settings_requested.connect(self.show_settings)
+        tray.about_requested.connect(self.show_about)
+        tray.exit_requested.connect(self.close_application)
     
     def on_panel_expanded(self):
         """Handle when the editor panel is expanded."""
         # Optionally minimize or hide the main window when panel is active
-        if get_setting("minimize_main_when_panel_open", False):
+        if self._minimize_on_expand:
             self.showMinimized()
     
     def on_panel_collapsed(self):
@@ -67,12 +237,12 @@ class PocketJournalMainWindow(QMainWindow):
     def on_dock_mode_changed(self, new_mode: str):
         """Handle when dock mode changes."""
         logger.info(f"Dock mode changed to: {new_mode}")
+        # The launcher manager builds a fresh tray (or drops it) on each switch
+        self._tray = self.launcher_manager.system_tray
+        
         # Reconnect tray signals if switching to tray mode
-        if new_mode == "tray" and hasattr(self.launcher_manager, 'system_tray') and self.launcher_manager.system_tray:
-            self.launcher_manager.system_tray.show_window_requested.connect(self.show_and_raise)
-            self.launcher_manager.system_tray.settings_requested.connect(self.show_settings)
-            self.launcher_manager.system_tray.about_requested.connect(self.show_about)
-            self.launcher_manager.system_tray.exit_requested.connect(self.close_application)
+        if new_mode == "tray" and self._tray is not None:
+            self._wire_tray_signals(self._tray)
     
     def show_and_raise(self):
         """Show and raise the main window (for tray mode)."""
@@ -82,18 +252,30 @@ class PocketJournalMainWindow(QMainWindow):
     
     def show_settings(self):
         """Show the settings dialog."""
+        from .ui.settings_dialog import show_settings_dialog
+        
         accepted, dialog = show_settings_dialog(self)
+        self.refresh_cached_settings()
         if dialog:
             # Handle settings changes
             dialog.dock_mode_changed.connect(self.handle_dock_mode_change)
     
+    def refresh_cached_settings(self):
+        """Re-read settings consulted on hot UI paths."""
+        self._minimize_on_expand = bool(
+            get_setting("minimize_main_when_panel_open", False)
+        )
+    
     def show_about(self):
         """Show the about dialog."""
-        from .ui.about_dialog import show_about_dialog
-        show_about_dialog(self)
+        if self._show_about_dialog is None:
+            from .ui.about_dialog import show_about_dialog
+            self._show_about_dialog = show_about_dialog
+        self._show_about_dialog(self)
     
     def handle_dock_mode_change(self, new_mode: str):
         """Handle dock mode change from settings."""
+        self.refresh_cached_settings()
         current_mode = get_setting("dock_mode", "corner")
         if new_mode != current_mode:
             # Show restart message
@@ -109,57 +291,67 @@ class PocketJournalMainWindow(QMainWindow):
         self.close()
     
     def setup_menu(self):
-        """Setup the main menu bar."""
+        """Setup the main menu bar; menu actions are built on first open."""
         menubar = self.menuBar()
         
-        # File menu
-        file_menu = menubar.addMenu("&File")
-        
-        quick_jot_action = QAction("&Quick Jot", self)
-        quick_jot_action.setShortcut("Ctrl+J")
-        quick_jot_action.triggered.connect(self.open_quick_jot)
+        for title, populate in (
+            ("&File", self._populate_file_menu),
+            ("&Tools", self._populate_tools_menu),
+            ("&Help", self._populate_help_menu),
+        ):
+            menu = menubar.addMenu(title)
+            menu.aboutToShow.connect(partial(self._populate_menu_once, menu, populate))
+        
+        # The actions don't exist until a menu opens, so their key bindings
+        # live on the window. Menu entries only display the key as a hint
+        # ("\t..."), which keeps each sequence bound exactly once.
+        for keys, slot in (
+            ("Ctrl+J", self.open_quick_jot),
+            ("Ctrl+Q", self.close),
+            ("F1", self.show_help_center),
+        ):
+            shortcut = QShortcut(QKeySequence(keys), self)
+            shortcut.activated.connect(slot)
+    
+    def _populate_menu_once(self, menu, populate):
+        """Fill a menu the first time it is about to be shown."""
+        if menu.isEmpty():
+            populate(menu)
+    
+    # QAction.triggered carries a `checked` bool; the lambdas below take it
+    # explicitly so it is never forwarded into a slot's own parameters
+    # (e.g. show_help_center's `section`).
+    
+    def _populate_file_menu(self, file_menu):
+        """Build the File menu actions."""
+        quick_jot_action = QAction("&Quick Jot\tCtrl+J", self)
+        quick_jot_action.triggered.connect(lambda _checked=False: self.open_quick_jot())
         file_menu.addAction(quick_jot_action)
         
         file_menu.addSeparator()
         
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
+        exit_action = QAction("E&xit\tCtrl+Q", self)
+        exit_action.triggered.connect(lambda _checked=False: self.close())
         file_menu.addAction(exit_action)
-        
-        # Tools menu
-        tools_menu = menubar.addMenu("&Tools")
-        
+    
+    def _populate_tools_menu(self, tools_menu):
+        """Build the Tools menu actions."""
         settings_action = QAction("&Settings...", self)
-        settings_action.triggered.connect(self.show_settings)
+        settings_action.triggered.connect(lambda _checked=False: self.show_settings())
         tools_menu.addAction(settings_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
-        
-        help_action = QAction("&Help Center", self)
-        help_action.setShortcut("F1")
-        help_action.triggered.connect(self.show_help_center)
+    
+    def _populate_help_menu(self, help_menu):
+        """Build the Help menu actions."""
+        help_action = QAction("&Help Center\tF1", self)
+        help_action.triggered.connect(lambda _checked=False: self.show_help_center())
         help_menu.addAction(help_action)
         
         help_menu.addSeparator()
         
         about_action = QAction("&About", self)
-        about_action.triggered.connect(self.show_about)
+        about_action.triggered.connect(lambda _checked=False: self.show_about())
         help_menu.addAction(about_action)
     
-    def setup_global_shortcuts(self):
-        """Setup global keyboard shortcuts."""
-        # F1 for help - accessible from anywhere in the application
-        f1_shortcut = QShortcut(QKeySequence("F1"), self)
-        f1_shortcut.activated.connect(self.show_help_center)
-        
-        # Additional global shortcuts for launcher access
-        if self.launcher_manager:
-            # Ctrl+J for quick jot (already in menu, but ensure global access)
-            quick_jot_shortcut = QShortcut(QKeySequence("Ctrl+J"), self)
-            quick_jot_shortcut.activated.connect(self.open_quick_jot)
-    
     def show_help_center(self, section=None):
         """Show the help center dialog."""
         try:
@@ -212,10 +404,10 @@ class PocketJournalMainWindow(QMainWindow):
         # Create main writing interface
         self.setup_writing_interface()
         
-        # Set window icon (placeholder path)
-        icon_path = Path(__file__).parent.parent.parent / "assets" / "icon.ico"
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+        # Set window icon
+        icon = _get_app_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
     
     def setup_writing_interface(self):
         """Setup the main writing-focused interface."""
@@ -249,59 +441,25 @@ class PocketJournalMainWindow(QMainWindow):
     
     def create_header_section(self):
         """Create the header with date and minimal controls."""
-        from datetime import datetime
-        
         header = QWidget()
+        header.setObjectName("header")
         header.setFixedHeight(60)
-        header.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(52, 73, 94, 0.9), stop:1 rgba(44, 62, 80, 0.9));
-                border-bottom: 2px solid rgba(52, 152, 219, 0.3);
-            }
-        """)
         
         layout = QHBoxLayout()
         layout.setContentsMargins(20, 15, 20, 15)
         header.setLayout(layout)
         
         # Date display
-        today = datetime.now().strftime("%B %d, %Y")
+        today = _format_date(date.today().toordinal())
         date_label = QLabel(today)
-        date_label.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                font-weight: 600;
-                color: #ecf0f1;
-                background: transparent;
-                border: none;
-            }
-        """)
+        date_label.setObjectName("dateLabel")
         layout.addWidget(date_label)
         
         layout.addStretch()
         
         # Quick actions
         new_btn = QPushButton("New Entry")
-        new_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3498db, stop:1 #2980b9);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 18px;
-                font-size: 13px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5dade2, stop:1 #3498db);
-            }
-            QPushButton:pressed {
-                background: #2980b9;
-            }
-        """)
+        new_btn.setObjectName("newEntryButton")
         new_btn.clicked.connect(self.new_entry)
         layout.addWidget(new_btn)
         
@@ -309,100 +467,42 @@ class PocketJournalMainWindow(QMainWindow):
     
     def create_writing_area(self):
         """Create the main writing area."""
-        from PySide6.QtWidgets import QTextEdit
+        from PySide6.QtWidgets import QPlainTextEdit
         
         # Container for writing area
         container = QWidget()
-        container.setStyleSheet("""
-            QWidget {
-                background: transparent;
-            }
-        """)
+        container.setObjectName("writingArea")
         layout = QVBoxLayout()
         layout.setContentsMargins(40, 30, 40, 30)
         container.setLayout(layout)
         
         # Entry title
         self.title_input = QLineEdit()
+        self.title_input.setObjectName("titleInput")
         self.title_input.setPlaceholderText("What's on your mind today?")
-        self.title_input.setStyleSheet("""
-            QLineEdit {
-                font-size: 24px;
-                font-weight: 600;
-                color: #ecf0f1;
-                background: rgba(52, 73, 94, 0.6);
-                border: none;
-                border-bottom: 3px solid rgba(52, 152, 219, 0.5);
-                border-radius: 8px;
-                padding: 15px;
-                margin-bottom: 20px;
-            }
-            QLineEdit:focus {
-                border-bottom: 3px solid #3498db;
-                background: rgba(52, 73, 94, 0.8);
-                outline: none;
-            }
-        """)
         layout.addWidget(self.title_input)
         
         # Main text editor
-        self.text_editor = QTextEdit()
+        self.text_editor = QPlainTextEdit()
+        self.text_editor.setObjectName("journalEditor")
         self.text_editor.setPlaceholderText("Take a moment to reflect...\n\nFor more thought-provoking questions and prompts, check out the Help menu.")
-        self.text_editor.setStyleSheet("""
-            QTextEdit {
-                font-size: 16px;
-                line-height: 1.6;
-                color: #ecf0f1;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #34495e, stop:0.5 #2c3e50, stop:1 #34495e);
-                border: 2px solid rgba(52, 152, 219, 0.3);
-                padding: 25px;
-                border-radius: 12px;
-                selection-background-color: #3498db;
-                selection-color: white;
-            }
-            QTextEdit:focus {
-                outline: none;
-                border: 2px solid #3498db;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2c3e50, stop:0.5 #34495e, stop:1 #2c3e50);
-            }
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                border: none;
-                border-radius: 4px;
-                width: 12px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(52, 152, 219, 0.7);
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(52, 152, 219, 0.9);
-            }
-        """)
         layout.addWidget(self.text_editor)
         
         # Set focus to text editor immediately
         self.text_editor.setFocus()
         
-        # Connect word count update
-        self.text_editor.textChanged.connect(self.update_word_count)
+        # Word counts per block, so an edit only recounts the blocks it touched
+        self._block_words = [0]
+        self._word_count = 0
+        self.text_editor.document().contentsChange.connect(self._on_contents_change)
         
         return container
     
     def create_bottom_bar(self):
         """Create the bottom bar with controls."""
         bottom_bar = QWidget()
+        bottom_bar.setObjectName("bottomBar")
         bottom_bar.setFixedHeight(50)
-        bottom_bar.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(44, 62, 80, 0.9), stop:1 rgba(52, 73, 94, 0.9));
-                border-top: 2px solid rgba(52, 152, 219, 0.3);
-            }
-        """)
         
         layout = QHBoxLayout()
         layout.setContentsMargins(20, 10, 20, 10)
@@ -410,39 +510,14 @@ class PocketJournalMainWindow(QMainWindow):
         
         # Word count
         self.word_count_label = QLabel("0 words")
-        self.word_count_label.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                color: rgba(236, 240, 241, 0.7);
-                background: transparent;
-                border: none;
-            }
-        """)
+        self.word_count_label.setObjectName("wordCountLabel")
         layout.addWidget(self.word_count_label)
         
         layout.addStretch()
         
         # Action buttons
         save_btn = QPushButton("Save")
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #27ae60, stop:1 #229954);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2ecc71, stop:1 #27ae60);
-            }
-            QPushButton:pressed {
-                background: #229954;
-            }
-        """)
+        save_btn.setObjectName("saveButton")
         save_btn.clicked.connect(self.save_entry)
         layout.addWidget(save_btn)
         
@@ -450,19 +525,12 @@ class PocketJournalMainWindow(QMainWindow):
     
     def apply_modern_styling(self):
         """Apply modern Windows 11-inspired styling with dark theme."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2c3e50, stop:0.5 #34495e, stop:1 #2c3e50);
-                color: #ecf0f1;
-            }
-            QWidget {
-                font-family: 'Segoe UI', 'Helvetica Neue', Helvetica, Arial, sans-serif;
-            }
-        """)
+        # One stylesheet for the whole window, parsed once
+        self.setStyleSheet(self._WINDOW_QSS)
     
     def new_entry(self):
         """Create a new entry."""
+        # Clearing the editor resets the word count through contentsChange
         self.title_input.clear()
         self.text_editor.clear()
         self.title_input.setFocus()
@@ -470,29 +538,74 @@ class PocketJournalMainWindow(QMainWindow):
     def save_entry(self):
         """Save the current entry."""
         title = self.title_input.text().strip()
-        content = self.text_editor.toPlainText().strip()
         
-        if not title and not content:
+        # The running word count is zero exactly when the body is blank
+        if not title and not self._word_count:
             return
         
         # For now, just show a message - implement actual saving later
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.information(self, "Saved", "Entry saved successfully!")
     
     def update_word_count(self):
-        """Update the word count display."""
-        content = self.text_editor.toPlainText()
-        word_count = len(content.split()) if content.strip() else 0
-        self.word_count_label.setText(f"{word_count} words")
+        """Recount the words of the whole document and update the display."""
+        document = self.text_editor.document()
+        if document.isEmpty():
+            self._block_words = [0]
+            self._word_count = 0
+            self.word_count_label.setText("0 words")
+            return
+        
+        counts = []
+        block = document.begin()
+        while block.isValid():
+            counts.append(count_words(block.text()))
+            block = block.next()
+        self._block_words = counts
+        self._word_count = sum(counts)
+        self.word_count_label.setText(f"{self._word_count} words")
+    
+    def _on_contents_change(self, position: int, chars_removed: int, chars_added: int):
+        """Adjust the word count for the blocks touched by an edit."""
+        document = self.text_editor.document()
+        if document.isEmpty() or chars_removed + chars_added > _WORD_COUNT_SPAN_LIMIT:
+            self.update_word_count()
+            return
+        
+        first = document.findBlock(position)
+        last = document.findBlock(position + chars_added)
+        if not last.isValid():
+            last = document.lastBlock()
+        start = first.blockNumber()
+        touched = last.blockNumber() - start + 1
+        # Blocks after the edit are unchanged, so the difference in block
+        # count tells how many old blocks the touched ones replace
+        replaced = touched - (document.blockCount() - len(self._block_words))
+        if replaced < 1 or start + replaced > len(self._block_words):
+            self.update_word_count()
+            return
+        
+        counts = []
+        block = first
+        for _ in range(touched):
+            counts.append(count_words(block.text()))
+            block = block.next()
+        old_counts = self._block_words[start:start + replaced]
+        self._block_words[start:start + replaced] = counts
+        self._word_count += sum(counts) - sum(old_counts)
+        self.word_count_label.setText(f"{self._word_count} words")
     
     def closeEvent(self, event):
         """Handle window close event to save settings."""
-        # Save window geometry
+        # Save window geometry in a single update (one write to disk)
         geometry = self.geometry()
-        settings.set("window_geometry.width", geometry.width())
-        settings.set("window_geometry.height", geometry.height())
-        settings.set("window_geometry.x", geometry.x())
-        settings.set("window_geometry.y", geometry.y())
+        settings.update({
+            "window_geometry": {
+                "width": geometry.width(),
+                "height": geometry.height(),
+                "x": geometry.x(),
+                "y": geometry.y()
+            }
+        })
         
         # Shutdown launcher manager
         if self.launcher_manager:
@@ -508,25 +621,37 @@ class PocketJournalApp:
     def __init__(self):
         self.app = None
         self.main_window = None
+        self._log_listener = None
         self._setup_logging()
     
     def _setup_logging(self):
         """Set up application logging."""
-        log_dir = settings.get_log_directory()
-        log_file = log_dir / "pocket_journal.log"
-        
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        # The log directory is created lazily by the handler on first write
+        log_file = settings.log_dir / "pocket_journal.log"
+        
+        # Configure logging (like basicConfig, leave existing setups alone)
+        root_logger = logging.getLogger()
+        if not root_logger.handlers:
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            # delay=True: the file is only opened on the first record
+            file_handler = _LazyFileHandler(log_file, encoding='utf-8', delay=True)
+            stream_handler = logging.StreamHandler(sys.stdout)
+            for handler in (file_handler, stream_handler):
+                handler.setFormatter(formatter)
+            
+            # Log calls only enqueue; a background listener does the I/O
+            log_queue = queue.SimpleQueue()
+            self._log_listener = QueueListener(
+                log_queue, file_handler, stream_handler
+            )
+            self._log_listener.start()
+            
+            root_logger.setLevel(logging.INFO)
+            root_logger.addHandler(QueueHandler(log_queue))
         
         # Log startup info
-        logger = logging.getLogger(__name__)
         logger.info(f"Starting {APP_NAME} v{VERSION}")
         logger.info(f"Settings file: {settings.settings_file}")
         logger.info(f"Data directory: {settings.data_dir}")
@@ -542,8 +667,7 @@ class PocketJournalApp:
         self.app.setOrganizationName(ORG_NAME)
         
         # Log application info
-        logger = logging.getLogger(__name__)
-        logger.info(f"Qt Application initialized")
+        logger.info("Qt Application initialized")
         logger.info(f"Settings loaded: theme={get_setting('theme')}, hotkey={get_setting('hotkey')}")
         
         # Create and show main window
@@ -556,6 +680,12 @@ class PocketJournalApp:
         # Start event loop
         exit_code = self.app.exec()
         logger.info(f"Application exiting with code {exit_code}")
+        
+        # Flush queued log records before the process exits
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+        
         return exit_code
 
 
@@ -8,10 +8,16 @@ change detection, and efficient caching to avoid unnecessary reprocessing.
 import fnmatch
 import logging
 import os
+import re
+import stat
+import struct
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union, Any
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union, Any
 from PIL import Image
 
 from ..data.database import get_database, FileRecord, FilesTable
@@ -19,6 +25,128 @@ from ..settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to walk several root directories at once
+_MAX_SCAN_WORKERS = 8
+
+# Coarsest directory mtime resolution to allow for (FAT/exFAT and many SMB
+# shares use 2 s); cached listings taken closer than this to the directory's
+# mtime are not trusted
+_DIR_MTIME_GRANULARITY_NS = 2_000_000_000
+
+# Reported once when a scan runs past config.max_scan_time
+_SCAN_TIME_LIMIT_WARNING = "Scan time limit exceeded"
+
+# Rule patterns that only test the file extension, e.g. "*.md"
+_SIMPLE_EXTENSION_RE = re.compile(r"^\*\.[A-Za-z0-9]+$")
+
+# Rule patterns that exclude a directory by name, e.g. "*/node_modules/*"
+_EXCLUDED_DIR_RE = re.compile(r"^\*/([^*?\[\]/]+)/\*$")
+
+# File suffixes whose pixel dimensions are checked against min_image_size
+_IMAGE_SUFFIXES = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'})
+
+# Bytes read up front when probing image dimensions
+_IMAGE_HEADER_SIZE = 32
+
+# JPEG start-of-frame markers; C4 (DHT), C8 (JPG) and CC (DAC) share the range
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _png_dims(header: bytes, f: BinaryIO) -> Optional[Tuple[int, int]]:
+    if header[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", header[16:24])
+
+
+def _gif_dims(header: bytes, f: BinaryIO) -> Optional[Tuple[int, int]]:
+    if header[:6] not in (b"GIF87a", b"GIF89a"):
+        return None
+    return struct.unpack("<HH", header[6:10])
+
+
+def _bmp_dims(header: bytes, f: BinaryIO) -> Optional[Tuple[int, int]]:
+    if struct.unpack("<I", header[14:18])[0] == 12:
+        # OS/2 BITMAPCOREHEADER stores 16-bit dimensions
+        return struct.unpack("<HH", header[18:22])
+    width, height = struct.unpack("<ii", header[18:26])
+    return width, abs(height)  # Negative height marks a top-down bitmap
+
+
+def _jpeg_dims(header: bytes, f: BinaryIO) -> Optional[Tuple[int, int]]:
+    # Walk the marker segments until a start-of-frame segment turns up
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte and byte != b"\xff":
+            byte = f.read(1)
+        while byte == b"\xff":
+            byte = f.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            continue  # Standalone markers carry no length
+        segment = f.read(2)
+        if len(segment) < 2:
+            return None
+        length = struct.unpack(">H", segment)[0]
+        if marker in _JPEG_SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">HH", frame[1:5])
+            return width, height
+        if marker == 0xD9 or length < 2:
+            return None
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _webp_dims(header: bytes, f: BinaryIO) -> Optional[Tuple[int, int]]:
+    if header[8:12] != b"WEBP":
+        return None
+    chunk = header[12:16]
+    if chunk == b"VP8 ":
+        if header[23:26] != b"\x9d\x01\x2a":
+            return None
+        width, height = struct.unpack("<HH", header[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        bits = struct.unpack("<I", header[21:25])[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        width = int.from_bytes(header[24:27], "little") + 1
+        height = int.from_bytes(header[27:30], "little") + 1
+        return width, height
+    return None
+
+
+# Header parsers keyed by the file's leading magic bytes
+_IMAGE_HEADER_PARSERS: Dict[bytes, Callable[[bytes, BinaryIO], Optional[Tuple[int, int]]]] = {
+    b"\x89PNG": _png_dims,
+    b"GIF8": _gif_dims,
+    b"BM": _bmp_dims,
+    b"\xff\xd8": _jpeg_dims,
+    b"RIFF": _webp_dims,
+}
+
+
+def _read_image_dims(path: Union[str, Path]) -> Optional[Tuple[int, int]]:
+    """
+    Read an image's width and height from its header without decoding it.
+    
+    Handles PNG, GIF, BMP, JPEG and WebP. Returns None when the format is not
+    recognised or the header is truncated.
+    """
+    with open(path, "rb") as f:
+        header = f.read(_IMAGE_HEADER_SIZE)
+        if len(header) < _IMAGE_HEADER_SIZE:
+            return None
+        parser = (_IMAGE_HEADER_PARSERS.get(header[:4])
+                  or _IMAGE_HEADER_PARSERS.get(header[:2]))
+        if parser is None:
+            return None
+        return parser(header, f)
+
 
 class ScanRule:
     """Represents an include or exclude rule for file scanning."""
@@ -39,16 +167,22 @@ class ScanRule:
         # Pre-compile pattern for efficiency
         if not case_sensitive:
             self.pattern = self.pattern.lower()
+        
+        # Translate the glob once; normcase mirrors what fnmatch.fnmatch does
+        # per call (case folding and separators on Windows)
+        self._regex = re.compile(fnmatch.translate(os.path.normcase(self.pattern)))
     
-    def matches(self, path: Path) -> bool:
+    def matches(self, path: Union[str, Path]) -> bool:
         """Check if a path matches this rule."""
-        test_path = str(path)
+        test_path = os.path.normcase(os.fspath(path))
+        name = os.path.basename(test_path)
         if not self.case_sensitive:
             test_path = test_path.lower()
+            name = name.lower()
         
         # Check against full path and just filename
-        return (fnmatch.fnmatch(test_path, self.pattern) or 
-                fnmatch.fnmatch(path.name if self.case_sensitive else path.name.lower(), self.pattern))
+        match = self._regex.match
+        return match(test_path) is not None or match(name) is not None
 
 
 class ScanConfig:
@@ -71,6 +205,9 @@ class ScanConfig:
         self.batch_size = 1000
         self.max_scan_time = 300  # seconds
         
+        # Database maintenance
+        self.cleanup_missing_files = True
+        
         # Default include/exclude rules
         self.rules = [
             # Include common document and text files
@@ -114,25 +251,102 @@ class ScanConfig:
             ScanRule("thumbs.db", "exclude"),
             ScanRule("*.lnk", "exclude"),
         ]
+        self._index_rules()
+    
+    def _index_rules(self):
+        """Split the rules into extension sets and glob lists for matching."""
+        include_exts, exclude_exts = set(), set()
+        excluded_dirs, excluded_dirs_case_sensitive = set(), set()
+        self._excludes, self._includes = [], []
+        
+        for rule in self.rules:
+            is_exclude = rule.rule_type == "exclude"
+            
+            # "*/name/*" excludes let the walk prune the whole directory
+            dir_match = _EXCLUDED_DIR_RE.match(rule.pattern) if is_exclude else None
+            if dir_match:
+                if rule.case_sensitive:
+                    excluded_dirs_case_sensitive.add(dir_match.group(1))
+                else:
+                    excluded_dirs.add(dir_match.group(1))
+            
+            # Plain "*.ext" rules become set lookups instead of glob matches
+            if not rule.case_sensitive and _SIMPLE_EXTENSION_RE.match(rule.pattern):
+                (exclude_exts if is_exclude else include_exts).add(rule.pattern[1:])
+            else:
+                (self._excludes if is_exclude else self._includes).append(rule)
+        
+        self._include_exts = frozenset(include_exts)
+        self._exclude_exts = frozenset(exclude_exts)
+        self._exclude_matchers = self._combine_rules(self._excludes)
+        self._include_matchers = self._combine_rules(self._includes)
+        self._excluded_dirs = frozenset(excluded_dirs)
+        self._excluded_dirs_case_sensitive = frozenset(excluded_dirs_case_sensitive)
+    
+    @staticmethod
+    def _combine_rules(rules: List[ScanRule]) -> List[Tuple["re.Pattern[str]", bool]]:
+        """
+        Merge glob rules into one alternation regex per case sensitivity.
+        
+        Only whether any rule of a kind matches matters, so one regex scan
+        per path replaces a Python-level loop over every rule.
+        """
+        matchers = []
+        for case_sensitive in (False, True):
+            patterns = [rule._regex.pattern for rule in rules
+                        if rule.case_sensitive == case_sensitive]
+            if patterns:
+                matchers.append((re.compile("|".join(patterns)), case_sensitive))
+        return matchers
+    
+    @staticmethod
+    def _matches_any(matchers: List[Tuple["re.Pattern[str]", bool]],
+                     path: Union[str, Path]) -> bool:
+        """Check a path, and its file name, against combined rule regexes."""
+        test_path = os.path.normcase(os.fspath(path))
+        name = os.path.basename(test_path)
+        for regex, case_sensitive in matchers:
+            if case_sensitive:
+                if regex.match(test_path) or regex.match(name):
+                    return True
+            elif regex.match(test_path.lower()) or regex.match(name.lower()):
+                return True
+        return False
+    
+    def is_excluded_dir(self, name: str) -> bool:
+        """Check if a directory name is excluded outright by a "*/name/*" rule."""
+        return (name.lower() in self._excluded_dirs or
+                name in self._excluded_dirs_case_sensitive)
     
     def add_rule(self, pattern: str, rule_type: str = "include", case_sensitive: bool = False):
         """Add a new scanning rule."""
         self.rules.append(ScanRule(pattern, rule_type, case_sensitive))
+        self._index_rules()
     
-    def should_include_path(self, path: Path) -> bool:
+    def should_include_path(self, path: Union[str, Path]) -> bool:
         """
         Determine if a path should be included based on rules.
         
-        Rules are evaluated in order. The last matching rule determines the result.
-        If no rules match, the default is to include the file.
+        Exclude rules are checked first and any match rejects the path, so an
+        exclude always wins over an include. Otherwise the path is included if
+        it matches an include rule. If no include rules are configured, every
+        path that is not excluded is included.
         """
-        last_match = "include"  # Default
+        name = os.path.basename(path)
+        dot = name.rfind('.')
+        ext = name[dot:].lower() if dot >= 0 else ""
         
-        for rule in self.rules:
-            if rule.matches(path):
-                last_match = rule.rule_type
+        if ext in self._exclude_exts:
+            return False
+        if self._exclude_matchers and self._matches_any(self._exclude_matchers, path):
+            return False
         
-        return last_match == "include"
+        if ext in self._include_exts:
+            return True
+        if self._include_matchers and self._matches_any(self._include_matchers, path):
+            return True
+        
+        return not (self._include_exts or self._includes)
     
     @classmethod
     def from_settings(cls) -> 'ScanConfig':
@@ -149,16 +363,19 @@ class ScanConfig:
         config.check_image_dimensions = settings.get("scan.check_image_dimensions", True)
         config.batch_size = settings.get("scan.batch_size", 1000)
         config.max_scan_time = settings.get("scan.max_scan_time", 300)
+        config.cleanup_missing_files = settings.get("scan.cleanup_missing_files", True)
         
-        # Load custom rules if any
+        # Load custom rules if any, indexing them once at the end
         custom_rules = settings.get("scan.custom_rules", [])
         for rule_data in custom_rules:
             if isinstance(rule_data, dict):
-                config.add_rule(
+                config.rules.append(ScanRule(
                     rule_data.get("pattern", ""),
                     rule_data.get("type", "include"),
                     rule_data.get("case_sensitive", False)
-                )
+                ))
+        if custom_rules:
+            config._index_rules()
         
         return config
 
@@ -181,7 +398,7 @@ class ScanResult:
         self.warnings: List[str] = []
         
         # File type statistics
-        self.files_by_type: Dict[str, int] = {}
+        self.files_by_type: Counter = Counter()
         
         # Size statistics
         self.total_size_bytes = 0
@@ -190,24 +407,30 @@ class ScanResult:
     
     def add_file(self, file_record: FileRecord, was_updated: bool):
         """Add a file to the scan results."""
-        self.files_found += 1
-        self.files_processed += 1
-        
-        if was_updated:
-            self.files_updated += 1
-        else:
-            self.files_new += 1
+        self.add_files([(file_record, was_updated)])
+    
+    def add_files(self, written: List[Tuple[FileRecord, bool]]):
+        """Add a batch of (file_record, was_updated) pairs to the scan results."""
+        if not written:
+            return
+        
+        count = len(written)
+        updated = sum(1 for _, was_updated in written if was_updated)
+        self.files_found += count
+        self.files_processed += count
+        self.files_updated += updated
+        self.files_new += count - updated
         
         # Update type statistics
-        file_type = file_record.file_type
-        self.files_by_type[file_type] = self.files_by_type.get(file_type, 0) + 1
+        self.files_by_type.update(record.file_type for record, _ in written)
         
         # Update size statistics
-        size = file_record.size_bytes
-        self.total_size_bytes += size
-        self.largest_file_size = max(self.largest_file_size, size)
-        if size > 0:
-            self.smallest_file_size = min(self.smallest_file_size, size)
+        sizes = [record.size_bytes for record, _ in written]
+        self.total_size_bytes += sum(sizes)
+        self.largest_file_size = max(self.largest_file_size, max(sizes))
+        nonzero = [size for size in sizes if size > 0]
+        if nonzero:
+            self.smallest_file_size = min(self.smallest_file_size, min(nonzero))
     
     def add_error(self, error: str):
         """Add an error to the scan results."""
@@ -243,7 +466,7 @@ class ScanResult:
             'files_unchanged': self.files_unchanged,
             'files_skipped': self.files_skipped,
             'total_size_mb': round(self.total_size_bytes / (1024 * 1024), 2),
-            'files_by_type': self.files_by_type,
+            'files_by_type': dict(self.files_by_type),
             'error_count': len(self.errors),
             'warning_count': len(self.warnings)
         }
@@ -260,7 +483,20 @@ class FileSystemScanner:
         self.db = get_database()
         self.files_table = FilesTable(self.db.files_table)
         
-    def _check_image_dimensions(self, file_path: Path) -> bool:
+        # Database writes are buffered and flushed every config.batch_size rows
+        self._pending_upserts: List[Tuple[FileRecord, str, os.stat_result]] = []
+        self._pending_last_seen: List[Tuple[str, datetime]] = []
+        
+        # Files written or confirmed by this scanner: path -> (size, mtime_ns,
+        # path_hash). Lets re-scans skip FileRecord construction, the change
+        # check and the image probe for files whose stat has not moved.
+        self._known_files: Dict[str, Tuple[int, int, str]] = {}
+        
+        # Directory listings from earlier scans: path -> (mtime_ns,
+        # listed_at_ns, [(name, is_file, is_dir, is_symlink), ...])
+        self._dir_listings: Dict[str, Tuple[int, int, List[Tuple[str, bool, bool, bool]]]] = {}
+        
+    def _check_image_dimensions(self, file_path: str) -> bool:
         """
         Check if an image meets minimum dimension requirements.
         
@@ -274,30 +510,32 @@ class FileSystemScanner:
             return True
         
         try:
-            with Image.open(file_path) as img:
-                width, height = img.size
-                return (width >= self.config.min_image_size or 
-                       height >= self.config.min_image_size)
+            dims = _read_image_dims(file_path)
+            if dims is None:
+                # Unknown or unusual header, let PIL work it out
+                with Image.open(file_path) as img:
+                    dims = img.size
+            width, height = dims
+            return (width >= self.config.min_image_size or 
+                    height >= self.config.min_image_size)
         except Exception as e:
             logger.warning(f"Could not check image dimensions for {file_path}: {e}")
             return True  # Include if we can't check
     
-    def _should_process_file(self, file_path: Path) -> Tuple[bool, str]:
+    def _should_process_file(self, file_path: str, stat_result: os.stat_result) -> Tuple[bool, str]:
         """
         Determine if a file should be processed.
         
         Args:
             file_path: Path to the file
+            stat_result: Stat of the file, taken once by the caller
             
         Returns:
             Tuple of (should_process, reason)
         """
         try:
-            # Check if file exists and is readable
-            if not file_path.exists():
-                return False, "File does not exist"
-            
-            if not file_path.is_file():
+            # A successful stat plus S_ISREG covers both exists() and is_file()
+            if not stat.S_ISREG(stat_result.st_mode):
                 return False, "Not a regular file"
             
             # Check include/exclude rules
@@ -305,105 +543,206 @@ class FileSystemScanner:
                 return False, "Excluded by rules"
             
             # Check file size
-            try:
-                size = file_path.stat().st_size
-                if size < self.config.min_file_size:
-                    return False, f"File too small ({size} bytes)"
-                if size > self.config.max_file_size:
-                    return False, f"File too large ({size} bytes)"
-            except OSError as e:
-                return False, f"Cannot stat file: {e}"
-            
-            # Check image dimensions if it's an image
-            suffix = file_path.suffix.lower()
-            if suffix in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']:
-                if not self._check_image_dimensions(file_path):
-                    return False, f"Image too small (< {self.config.min_image_size}px)"
+            size = stat_result.st_size
+            if size < self.config.min_file_size:
+                return False, f"File too small ({size} bytes)"
+            if size > self.config.max_file_size:
+                return False, f"File too large ({size} bytes)"
             
+            # Image dimensions are checked later, in _process_file, and only
+            # for files that are new or changed
             return True, "OK"
             
         except Exception as e:
             return False, f"Error checking file: {e}"
     
-    def _has_file_changed(self, file_path: Path, existing_record: FileRecord) -> bool:
+    def _has_file_changed(self, stat_result: os.stat_result, existing_record: FileRecord) -> bool:
         """
         Check if a file has changed since last scan.
         
         Args:
-            file_path: Path to the file
+            stat_result: Current stat of the file
             existing_record: Existing database record
             
         Returns:
             True if file has changed, False otherwise
         """
-        try:
-            stat = file_path.stat()
-            
-            # Check size and modification time
-            return (stat.st_size != existing_record.size_bytes or 
-                   abs(stat.st_mtime - existing_record.mtime) > 1.0)  # 1 second tolerance
+        # Check size and modification time
+        return (stat_result.st_size != existing_record.size_bytes or 
+               abs(stat_result.st_mtime - existing_record.mtime) > 1.0)  # 1 second tolerance
+    
+    def _scan_directory(self, root: str, result: ScanResult,
+                        files: List[Tuple[str, Optional[os.stat_result]]],
+                        problems: List[Tuple[str, str]]):
+        """
+        Collect the files under a directory tree.
+        
+        The tree is walked depth-first with an explicit stack rather than by
+        recursion, so deep trees cost no Python frames and cannot hit the
+        recursion limit. This only walks the file system and never touches
+        the database or mutates the scan result, so it is safe to run on a
+        worker thread.
+        
+        Args:
+            root: Directory to scan
+            result: Scan result (read for the elapsed scan time only)
+            files: List to append (path, stat or None) pairs for found files to
+            problems: List to append ("warning" | "error", message) pairs to
+        """
+        stack = [(root, 0)]
+        while stack:
+            directory, depth = stack.pop()
+            try:
+                try:
+                    dir_stat = os.stat(directory)
+                except OSError:
+                    dir_stat = None
+                if dir_stat is None or not stat.S_ISDIR(dir_stat.st_mode):
+                    problems.append(("warning", f"Directory does not exist or is not a directory: {directory}"))
+                    continue
+                
+                # Check depth limit
+                if depth > self.config.max_depth:
+                    problems.append(("warning", f"Maximum depth exceeded for {directory}"))
+                    continue
+                
+                # Adding, removing or renaming an entry bumps the directory's
+                # mtime, so an unchanged mtime means the cached listing is
+                # current -- unless the listing was taken within the mtime
+                # granularity of that mtime, when a later change in the same
+                # tick would leave it unchanged ("racy", as git calls it)
+                cached = self._dir_listings.get(directory)
+                if (cached is not None and cached[0] == dir_stat.st_mtime_ns
+                        and cached[1] - cached[0] > _DIR_MTIME_GRANULARITY_NS):
+                    children = [(os.path.join(directory, name), is_file, is_dir, is_link, None)
+                                for name, is_file, is_dir, is_link in cached[2]]
+                else:
+                    # Taken before listing, so it never postdates what was seen
+                    listed_at_ns = time.time_ns()
+                    
+                    # DirEntry carries the file type from readdir, so
+                    # is_file/is_dir/is_symlink need no extra stat calls
+                    try:
+                        with os.scandir(directory) as it:
+                            children = [(entry.path, entry.is_file(), entry.is_dir(),
+                                         entry.is_symlink(), entry) for entry in it]
+                    except PermissionError:
+                        problems.append(("warning", f"Permission denied accessing directory: {directory}"))
+                        continue
+                    self._dir_listings[directory] = (
+                        dir_stat.st_mtime_ns,
+                        listed_at_ns,
+                        [(os.path.basename(path), is_file, is_dir, is_link)
+                         for path, is_file, is_dir, is_link, _ in children],
+                    )
+                
+                subdirs = []
+                for path, is_file, is_dir, is_link, entry in children:
+                    # Check scan time limit
+                    if result.duration_seconds > self.config.max_scan_time:
+                        problems.append(("warning", _SCAN_TIME_LIMIT_WARNING))
+                        return
+                    
+                    try:
+                        if is_file:
+                            # Stat here, off the main thread. File contents can
+                            # change without touching the directory, so this is
+                            # needed even when the listing came from the cache.
+                            try:
+                                file_stat = entry.stat() if entry is not None else os.stat(path)
+                            except OSError:
+                                file_stat = None  # Reported when the file is processed
+                            files.append((path, file_stat))
+                        elif is_dir and self.config.recursive:
+                            # Prune excluded directories instead of filtering
+                            # every file underneath them
+                            if self.config.is_excluded_dir(os.path.basename(path)):
+                                continue
+                            
+                            if self.config.follow_symlinks or not is_link:
+                                subdirs.append((path, depth + 1))
+                    
+                    except PermissionError:
+                        problems.append(("warning", f"Permission denied accessing: {path}"))
+                    except Exception as e:
+                        problems.append(("error", f"Error processing {path}: {e}"))
+                
+                # Reversed so subdirectories come off the stack in listing order
+                stack.extend(reversed(subdirs))
             
-        except OSError:
-            # If we can't stat the file, assume it changed
-            return True
+            except Exception as e:
+                problems.append(("error", f"Error scanning directory {directory}: {e}"))
     
-    def _scan_directory(self, directory: Path, result: ScanResult, depth: int = 0) -> Set[str]:
+    def _walk_tree(self, directory: str, result: ScanResult
+                   ) -> Tuple[List[Tuple[str, Optional[os.stat_result]]], List[Tuple[str, str]]]:
+        """Walk one root directory, returning its files and problems."""
+        files: List[Tuple[str, Optional[os.stat_result]]] = []
+        problems: List[Tuple[str, str]] = []
+        self._scan_directory(directory, result, files, problems)
+        return files, problems
+    
+    def _scan_directories(self, directories: List[Path], result: ScanResult,
+                          found_hashes: Optional[Set[str]] = None) -> Set[str]:
         """
-        Scan a single directory.
+        Scan several root directories.
+        
+        The walks run in parallel threads (scandir/stat release the GIL);
+        results are then processed on the calling thread, since ScanResult
+        and FilesTable are not thread-safe.
         
         Args:
-            directory: Directory to scan
+            directories: Root directories to scan
             result: Scan result to update
-            depth: Current recursion depth
+            found_hashes: Path hashes already found in this scan, added to
             
         Returns:
             Set of path hashes for found files
         """
-        found_hashes = set()
-        
-        try:
-            if not directory.exists() or not directory.is_dir():
-                result.add_warning(f"Directory does not exist or is not a directory: {directory}")
-                return found_hashes
-            
-            # Check depth limit
-            if depth > self.config.max_depth:
-                result.add_warning(f"Maximum depth exceeded for {directory}")
-                return found_hashes
-            
-            # Scan directory contents
-            try:
-                entries = list(directory.iterdir())
-            except PermissionError:
-                result.add_warning(f"Permission denied accessing directory: {directory}")
-                return found_hashes
-            
-            for entry in entries:
-                # Check scan time limit
-                if result.duration_seconds > self.config.max_scan_time:
-                    result.add_warning("Scan time limit exceeded")
-                    break
-                
-                try:
-                    if entry.is_file():
-                        self._process_file(entry, result, found_hashes)
-                    elif entry.is_dir() and self.config.recursive:
-                        # Recursively scan subdirectory
-                        if self.config.follow_symlinks or not entry.is_symlink():
-                            subdir_hashes = self._scan_directory(entry, result, depth + 1)
-                            found_hashes.update(subdir_hashes)
-                
-                except PermissionError:
-                    result.add_warning(f"Permission denied accessing: {entry}")
-                except Exception as e:
-                    result.add_error(f"Error processing {entry}: {e}")
-        
-        except Exception as e:
-            result.add_error(f"Error scanning directory {directory}: {e}")
+        if found_hashes is None:
+            found_hashes = set()
+        if len(directories) > 1:
+            workers = min(_MAX_SCAN_WORKERS, len(directories))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # map() yields each walk as soon as it (and the ones before
+                # it) finish, so roots are processed while later ones are
+                # still being walked
+                walks = pool.map(self._walk_tree, map(os.fspath, directories),
+                                 repeat(result))
+                self._process_walks(walks, result, found_hashes)
+        else:
+            walks = (self._walk_tree(os.fspath(directory), result) for directory in directories)
+            self._process_walks(walks, result, found_hashes)
         
         return found_hashes
     
-    def _process_file(self, file_path: Path, result: ScanResult, found_hashes: Set[str]):
+    def _process_walks(self, walks: Iterable[Tuple[List[Tuple[str, Optional[os.stat_result]]],
+                                                   List[Tuple[str, str]]]],
+                       result: ScanResult, found_hashes: Set[str]):
+        """Process the files of each finished walk, within the scan time limit."""
+        for files, problems in walks:
+            for kind, message in problems:
+                if message == _SCAN_TIME_LIMIT_WARNING:
+                    self._scan_time_exceeded(result)
+                elif kind == "error":
+                    result.add_error(message)
+                else:
+                    result.add_warning(message)
+            
+            for path, file_stat in files:
+                if self._scan_time_exceeded(result):
+                    return
+                self._process_file(path, result, found_hashes, file_stat)
+    
+    def _scan_time_exceeded(self, result: ScanResult) -> bool:
+        """Check the scan time limit, warning the first time it is hit."""
+        if result.duration_seconds <= self.config.max_scan_time:
+            return False
+        if _SCAN_TIME_LIMIT_WARNING not in result.warnings:
+            result.add_warning(_SCAN_TIME_LIMIT_WARNING)
+        return True
+    
+    def _process_file(self, file_path: str, result: ScanResult, found_hashes: Set[str],
+                      stat_result: Optional[os.stat_result] = None):
         """
         Process a single file.
         
@@ -411,47 +750,119 @@ class FileSystemScanner:
             file_path: Path to the file
             result: Scan result to update
             found_hashes: Set to add path hash to
+            stat_result: Stat taken by the directory walk, if any
         """
         try:
+            # Stat the file exactly once
+            if stat_result is None:
+                try:
+                    stat_result = os.stat(file_path)
+                except OSError as e:
+                    result.files_skipped += 1
+                    logger.debug(f"Skipping {file_path}: Cannot stat file: {e}")
+                    return
+            
             # Check if file should be processed
-            should_process, reason = self._should_process_file(file_path)
+            should_process, reason = self._should_process_file(file_path, stat_result)
             if not should_process:
                 result.files_skipped += 1
                 logger.debug(f"Skipping {file_path}: {reason}")
                 return
             
+            # Fast path: same size and mtime as when this scanner last saw it.
+            # The cache is advisory: another scanner may have cleaned up the
+            # row since, in which case the file is handled as new below.
+            known = self._known_files.get(file_path)
+            if (known is not None and known[0] == stat_result.st_size
+                    and known[1] == stat_result.st_mtime_ns
+                    and self.files_table.get_by_path_hash(known[2]) is not None):
+                found_hashes.add(known[2])
+                self._pending_last_seen.append((known[2], datetime.now()))
+                result.files_unchanged += 1
+                self._flush_if_full(result)
+                return
+            
             # Create file record
             scan_time = datetime.now()
-            file_record = FileRecord.from_file_path(file_path, scan_time)
+            # Paths stay plain strings up to here; FileRecord wants a Path
+            file_record = FileRecord.from_file_path(Path(file_path), scan_time)
             path_hash = file_record.path_hash
-            found_hashes.add(path_hash)
+            
+            # Already handled earlier in this scan (e.g. passed directly and
+            # found again inside a passed directory); its write may still be
+            # buffered, so the database can't tell
+            if path_hash in found_hashes:
+                result.files_unchanged += 1
+                return
             
             # Check if file exists in database
             existing_record = self.files_table.get_by_path_hash(path_hash)
+            changed = (existing_record is None or
+                       self._has_file_changed(stat_result, existing_record))
+            
+            # Probe image dimensions last, and only for new or changed
+            # files; an unchanged record already passed this check
+            if (changed and os.path.splitext(file_path)[1].lower() in _IMAGE_SUFFIXES
+                    and not self._check_image_dimensions(file_path)):
+                result.files_skipped += 1
+                logger.debug(f"Skipping {file_path}: Image too small "
+                             f"(< {self.config.min_image_size}px)")
+                return
+            
+            found_hashes.add(path_hash)
             
             if existing_record:
                 # File exists, check if it changed
-                if self._has_file_changed(file_path, existing_record):
+                if changed:
                     # File changed, update record
                     file_record.data['scan_count'] = existing_record.data.get('scan_count', 0) + 1
                     file_record.data['is_processed'] = False  # Mark for reprocessing
-                    was_updated = self.files_table.upsert_file(file_record)
-                    result.add_file(file_record, was_updated)
+                    self._pending_upserts.append((file_record, file_path, stat_result))
                     logger.debug(f"Updated changed file: {file_path}")
                 else:
                     # File unchanged, just update last_seen_at
-                    self.files_table.update_last_seen(path_hash, scan_time)
+                    self._pending_last_seen.append((path_hash, scan_time))
+                    self._known_files[file_path] = (
+                        stat_result.st_size, stat_result.st_mtime_ns, path_hash)
                     result.files_unchanged += 1
                     logger.debug(f"File unchanged: {file_path}")
             else:
                 # New file, insert record
-                was_updated = self.files_table.upsert_file(file_record)
-                result.add_file(file_record, was_updated)
+                self._pending_upserts.append((file_record, file_path, stat_result))
                 logger.debug(f"Added new file: {file_path}")
+            
+            self._flush_if_full(result)
                 
         except Exception as e:
             result.add_error(f"Error processing file {file_path}: {e}")
     
+    def _flush_if_full(self, result: ScanResult):
+        """Flush buffered database writes once config.batch_size is reached."""
+        if (len(self._pending_upserts) + len(self._pending_last_seen)
+                >= self.config.batch_size):
+            self._flush_pending(result)
+    
+    def _flush_pending(self, result: ScanResult):
+        """Write buffered upserts and last-seen updates to the database."""
+        upserts, self._pending_upserts = self._pending_upserts, []
+        last_seen, self._pending_last_seen = self._pending_last_seen, []
+        
+        written = []
+        for file_record, path_key, stat_result in upserts:
+            try:
+                written.append((file_record, self.files_table.upsert_file(file_record)))
+                self._known_files[path_key] = (
+                    stat_result.st_size, stat_result.st_mtime_ns, file_record.path_hash)
+            except Exception as e:
+                result.add_error(f"Error saving file {file_record.path_hash}: {e}")
+        result.add_files(written)
+        
+        for path_hash, seen_at in last_seen:
+            try:
+                self.files_table.update_last_seen(path_hash, seen_at)
+            except Exception as e:
+                result.add_error(f"Error updating file {path_hash}: {e}")
+    
     def scan_paths(self, paths: List[Union[str, Path]]) -> ScanResult:
         """
         Scan multiple paths.
@@ -470,24 +881,32 @@ class FileSystemScanner:
         all_found_hashes = set()
         
         try:
+            directories = []
             for path in result.scanned_paths:
                 path_obj = Path(path)
                 
                 if path_obj.is_file():
                     # Scan single file
-                    self._process_file(path_obj, result, all_found_hashes)
+                    self._process_file(str(path_obj), result, all_found_hashes)
                 elif path_obj.is_dir():
-                    # Scan directory
-                    found_hashes = self._scan_directory(path_obj, result)
-                    all_found_hashes.update(found_hashes)
+                    directories.append(path_obj)
                 else:
                     result.add_warning(f"Path does not exist or is not accessible: {path}")
             
+            # Scan directories
+            self._scan_directories(directories, result, all_found_hashes)
+            self._flush_pending(result)
+            
             # Clean up database (remove records for files that no longer exist)
-            # Note: Only do this if we scanned directories, not individual files
-            dir_scans = [p for p in result.scanned_paths if Path(p).is_dir()]
-            if dir_scans and settings.get("scan.cleanup_missing_files", True):
+            # Note: Only do this if we scanned directories, not individual files,
+            # and the scan finished; files it never reached are not missing
+            if (directories and self.config.cleanup_missing_files
+                    and _SCAN_TIME_LIMIT_WARNING not in result.warnings):
                 cleanup_count = self.files_table.cleanup_missing_files(list(all_found_hashes))
+                self._known_files = {
+                    path_key: known for path_key, known in self._known_files.items()
+                    if known[2] in all_found_hashes
+                }
                 if cleanup_count > 0:
                     logger.info(f"Cleaned up {cleanup_count} missing file records")
                     result.add_warning(f"Removed {cleanup_count} records for missing files")
@@ -496,6 +915,7 @@ class FileSystemScanner:
             result.add_error(f"Critical scan error: {e}")
         
         finally:
+            self._flush_pending(result)
             result.finalize()
         
         logger.info(f"Scan completed in {result.duration_seconds:.2f}s: "
@@ -5,14 +5,23 @@ This module handles loading, saving, and managing application settings
 using platformdirs for cross-platform user data directory access.
 """
 
+import atexit
 import json
 import logging
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from platformdirs import user_data_dir, user_config_dir
 
 from .app_meta import APP_NAME, ORG_NAME
 
+try:
+    import orjson  # Optional, much faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -87,6 +96,52 @@ DEFAULT_SETTINGS = {
 }
 
 
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize settings as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@contextmanager
+def _file_lock(lock_path: Path):
+    """
+    Hold an exclusive lock on a sidecar file so that two PocketJournal
+    processes don't write settings at the same time. If locking isn't
+    possible the write goes ahead unlocked.
+    """
+    with open(lock_path, 'a+b') as lock_file:
+        locked = False
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            locked = True
+        except OSError as e:
+            logger.warning(f"Could not lock {lock_path}: {e}")
+        
+        try:
+            yield
+        finally:
+            if locked:
+                if os.name == 'nt':
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 class SettingsManager:
     """Manages application settings with automatic loading and saving."""
     
@@ -96,6 +151,17 @@ class SettingsManager:
         self._settings_file = self._settings_dir / "settings.json"
         self._data_dir = Path(user_data_dir(APP_NAME, ORG_NAME))
         
+        # Writes are debounced so bursts of set() calls cost one save
+        self._lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self._last_payload: Optional[str] = None
+        
+        # Dotted key -> value for every nested level, rebuilt lazily after
+        # any change so get() is a single dict lookup
+        self._flat: Optional[Dict[str, Any]] = None
+        atexit.register(self.flush)
+        
         # Ensure directories exist
         self._settings_dir.mkdir(parents=True, exist_ok=True)
         self._data_dir.mkdir(parents=True, exist_ok=True)
@@ -118,20 +184,43 @@ class SettingsManager:
         """Get the path to the settings directory."""
         return self._settings_dir
     
+    @property
+    def log_dir(self) -> Path:
+        """Get the path to the log directory (not created on access)."""
+        return self._data_dir / "logs"
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get a setting value by key, with optional default."""
-        keys = key.split('.')
-        value = self._settings
+        flat = self._flat
+        if flat is None:
+            with self._lock:
+                flat = self._flat = self._flatten()
+        return flat.get(key, default)
+    
+    def _flatten(self) -> Dict[str, Any]:
+        """Map every dotted key path in the settings to its value."""
+        flat: Dict[str, Any] = {}
         
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        def walk(prefix: str, d: Dict[str, Any]) -> None:
+            for k, v in d.items():
+                key = prefix + k
+                flat[key] = v
+                if isinstance(v, dict):
+                    walk(key + '.', v)
+        
+        walk('', self._settings)
+        return flat
     
     def set(self, key: str, value: Any) -> None:
         """Set a setting value by key."""
+        with self._lock:
+            self._set_value(key, value)
+        
+        # Auto-save after setting
+        self._schedule_save()
+    
+    def _set_value(self, key: str, value: Any) -> None:
+        """Store a value under a dotted key without saving."""
         keys = key.split('.')
         setting = self._settings
         
@@ -143,9 +232,7 @@ class SettingsManager:
         
         # Set the value
         setting[keys[-1]] = value
-        
-        # Auto-save after setting
-        self.save()
+        self._flat = None
     
     def update(self, settings: Dict[str, Any]) -> None:
         """Update multiple settings at once."""
@@ -157,14 +244,18 @@ class SettingsManager:
                     d[k] = v
             return d
         
-        deep_update(self._settings, settings)
-        self.save()
+        with self._lock:
+            deep_update(self._settings, settings)
+            self._flat = None
+        self._schedule_save()
     
     def reset(self, key: Optional[str] = None) -> None:
         """Reset a specific setting or all settings to defaults."""
         if key is None:
             # Reset all settings
-            self._settings = DEFAULT_SETTINGS.copy()
+            with self._lock:
+                self._settings = DEFAULT_SETTINGS.copy()
+                self._flat = None
         else:
             # Reset specific setting
             keys = key.split('.')
@@ -173,19 +264,21 @@ class SettingsManager:
             try:
                 for k in keys:
                     default_value = default_value[k]
-                self.set(key, default_value)
             except (KeyError, TypeError):
                 logger.warning(f"Cannot reset unknown setting key: {key}")
                 return
+            
+            with self._lock:
+                self._set_value(key, default_value)
         
-        self.save()
+        self._schedule_save()
     
     def load(self) -> bool:
         """Load settings from file. Returns True if successful."""
         try:
             if self._settings_file.exists():
                 with open(self._settings_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
+                    loaded_settings = _loads(f.read())
                 
                 # Merge with defaults to ensure all keys are present
                 self._merge_with_defaults(loaded_settings)
@@ -202,19 +295,56 @@ class SettingsManager:
             logger.info("Using default settings")
             return False
     
+    def _schedule_save(self) -> None:
+        """Save after the debounce interval, restarting it if already pending."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            
+            delay = self._settings.get("autosave_debounce_ms", 900) / 1000
+            self._save_timer = threading.Timer(delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self) -> bool:
+        """Write any pending changes now. Returns True if nothing failed."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            return self.save()
+    
     def save(self) -> bool:
         """Save current settings to file. Returns True if successful."""
         try:
             # Ensure directory exists
             self._settings_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self._settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                payload = _dumps(self._settings)
+                self._dirty = False
+            
+            # Nothing changed since the last write
+            if payload == self._last_payload:
+                return True
+            
+            # Write a temp file and swap it in, so a crash mid-write never
+            # leaves a truncated settings.json behind
+            temp_file = self._settings_file.with_suffix(".json.tmp")
+            with _file_lock(self._settings_file.with_suffix(".json.lock")):
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(temp_file, self._settings_file)
+            self._last_payload = payload
             
             logger.debug(f"Settings saved to {self._settings_file}")
             return True
             
         except (IOError, TypeError) as e:
+            self._dirty = True  # Retried by the next flush
             logger.error(f"Failed to save settings to {self._settings_file}: {e}")
             return False
     
@@ -229,7 +359,9 @@ class SettingsManager:
                     result[key] = value
             return result
         
-        self._settings = merge_dict(DEFAULT_SETTINGS, loaded_settings)
+        with self._lock:
+            self._settings = merge_dict(DEFAULT_SETTINGS, loaded_settings)
+            self._flat = None
     
     def get_journal_directory(self) -> Path:
         """Get the default directory for journal files."""
@@ -245,7 +377,7 @@ class SettingsManager:
     
     def get_log_directory(self) -> Path:
         """Get the directory for log files."""
-        log_dir = self._data_dir / "logs"
+        log_dir = self.log_dir
         log_dir.mkdir(parents=True, exist_ok=True)
         return log_dir
     
@@ -253,7 +385,7 @@ class SettingsManager:
         """Export current settings to a file."""
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2, ensure_ascii=False)
+                f.write(_dumps(self._settings))
             logger.info(f"Settings exported to {file_path}")
             return True
         except (IOError, TypeError) as e:
@@ -264,7 +396,7 @@ class SettingsManager:
         """Import settings from a file."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                imported_settings = json.load(f)
+                imported_settings = _loads(f.read())
             
             self._merge_with_defaults(imported_settings)
             self.save()
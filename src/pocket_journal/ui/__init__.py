@@ -1,26 +1,42 @@
-"""User interface components for PocketJournal."""
-
-from .micro_launcher import CircularLauncher
-from .editor_panel_integrated import IntegratedEditorPanel
-from .launcher_manager import LauncherManager
-from .system_tray import SystemTrayManager, DockModeManager, StartupManager
-from .settings_dialog import SettingsDialog, show_settings_dialog
-from .entry_actions import EntryActionsManager, EntryActionsMenu, open_data_folder
-from .recent_and_search import RecentEntriesPopover, SearchDialog, FastSearchEngine
-
-__all__ = [
-    'CircularLauncher',
-    'IntegratedEditorPanel',
-    'LauncherManager',
-    'SystemTrayManager',
-    'DockModeManager',
-    'StartupManager',
-    'SettingsDialog',
-    'show_settings_dialog',
-    'EntryActionsManager',
-    'EntryActionsMenu',
-    'open_data_folder',
-    'RecentEntriesPopover',
-    'SearchDialog',
-    'FastSearchEngine'
-]
\ No newline at end of file
+"""User interface components for PocketJournal.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+one component doesn't pull in every other widget module as well.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'CircularLauncher': 'micro_launcher',
+    'IntegratedEditorPanel': 'editor_panel_integrated',
+    'LauncherManager': 'launcher_manager',
+    'SystemTrayManager': 'system_tray',
+    'DockModeManager': 'system_tray',
+    'StartupManager': 'system_tray',
+    'SettingsDialog': 'settings_dialog',
+    'show_settings_dialog': 'settings_dialog',
+    'EntryActionsManager': 'entry_actions',
+    'EntryActionsMenu': 'entry_actions',
+    'open_data_folder': 'entry_actions',
+    'RecentEntriesPopover': 'recent_and_search',
+    'SearchDialog': 'recent_and_search',
+    'FastSearchEngine': 'recent_and_search',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
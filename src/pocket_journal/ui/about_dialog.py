@@ -7,48 +7,386 @@ and recent changelog entries.
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QGroupBox, QTextEdit, QFrame
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, 
+    QGroupBox, QScrollArea, QFrame, QMessageBox
 )
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt, QTimer, QUrl
 from PySide6.QtGui import QFont, QDesktopServices
+from platformdirs import user_data_dir, user_config_dir
+from shiboken6 import isValid
 
 from ..app_meta import APP_NAME, ORG_NAME, VERSION, BUILD_DATE, CHANNEL, get_version_string
 
 logger = logging.getLogger(__name__)
 
+# User directories don't move while the app runs, so resolve them once
+_DATA_DIR = user_data_dir(APP_NAME, ORG_NAME)
+_CONFIG_DIR = user_config_dir(APP_NAME, ORG_NAME)
+
+# Directories already created this run, so repeat clicks skip makedirs
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory the first time it is needed in this process."""
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+# Static about-dialog text; its inputs are fixed for the process lifetime
+_ABOUT_TITLE = f"About {APP_NAME}"
+_CREDITS_HTML = f"""
+<h3>Credits & Acknowledgments</h3>
+
+<p><b>{APP_NAME}</b> is built with the following technologies:</p>
+
+<ul>
+<li><b>PySide6</b> - Modern Qt bindings for Python</li>
+<li><b>Python</b> - The programming language</li>
+<li><b>PyYAML</b> - YAML parsing and generation</li>
+<li><b>platformdirs</b> - Cross-platform data directories</li>
+<li><b>markdown-it-py</b> - Markdown processing</li>
+<li><b>pytest</b> - Testing framework</li>
+</ul>
+
+<p><b>Special Thanks:</b></p>
+<ul>
+<li>The Qt Company for the excellent Qt framework</li>
+<li>The Python Software Foundation</li>
+<li>All open source contributors</li>
+</ul>
+
+<p><b>Development:</b><br>
+Built with love for personal productivity and journaling.</p>
+"""
+
+_VERSION_ROWS = (
+    ("Version:", VERSION),
+    ("Build Date:", BUILD_DATE),
+    ("Channel:", CHANNEL.title()),
+    ("Full Version:", get_version_string()),
+)
+
+# One stylesheet for the whole dialog: Qt parses and polishes it in a single
+# pass, and object names pick out the widgets each rule is meant for
+_DIALOG_QSS = """
+QDialog {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #2c3e50, stop:0.5 #34495e, stop:1 #2c3e50);
+    color: white;
+    border-radius: 12px;
+}
+
+QFrame#headerFrame {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 rgba(52, 152, 219, 0.8), stop:1 rgba(41, 128, 185, 0.9));
+    border: 2px solid rgba(255, 255, 255, 0.1);
+    border-radius: 12px;
+    padding: 15px;
+    margin: 2px;
+}
+QFrame#headerFrame QLabel {
+    background: transparent;
+    border: none;
+    padding: 15px;
+    margin: 2px;
+}
+QLabel#appIcon {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+        stop:0 #3498db, stop:1 #2980b9);
+    border: 2px solid rgba(255, 255, 255, 0.2);
+    border-radius: 30px;
+    color: white;
+    font-size: 22px;
+    font-weight: bold;
+    font-family: 'Segoe UI', sans-serif;
+}
+QLabel#appName {
+    color: white;
+    margin-bottom: 3px;
+}
+QLabel#appTagline {
+    color: rgba(255, 255, 255, 0.9);
+    margin-bottom: 5px;
+}
+QLabel#appOrg {
+    color: rgba(255, 255, 255, 0.7);
+}
+
+QGroupBox {
+    background: rgba(44, 62, 80, 0.6);
+    border: 2px solid rgba(255, 255, 255, 0.1);
+    border-radius: 8px;
+    padding: 8px;
+    margin-top: 5px;
+    color: white;
+    font-weight: bold;
+    font-size: 12px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 8px;
+    padding: 0 6px 0 6px;
+    color: rgba(255, 255, 255, 0.9);
+}
+
+QGroupBox#versionGroup QLabel {
+    background: transparent;
+    border: none;
+    color: rgba(255, 255, 255, 0.9);
+    font-size: 11px;
+    font-weight: normal;
+}
+QGroupBox#versionGroup QLabel#versionKey {
+    color: #3498db;
+    font-weight: bold;
+}
+
+QLabel#pathLabel {
+    background: transparent;
+    border: none;
+    color: white;
+    padding: 3px;
+    font-size: 10px;
+}
+QPushButton#openButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #3498db, stop:1 #2980b9);
+    color: white;
+    border: none;
+    border-radius: 6px;
+    font-weight: bold;
+    font-size: 11px;
+}
+QPushButton#openButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #5dade2, stop:1 #3498db);
+}
+QPushButton#openButton:pressed {
+    background: #2980b9;
+}
+
+QScrollArea#changelogScroll {
+    background: rgba(52, 73, 94, 0.7);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: 6px;
+}
+QLabel#changelogText {
+    background: transparent;
+    color: white;
+    font-family: 'Segoe UI', sans-serif;
+    font-size: 10px;
+    padding: 6px;
+    selection-background-color: #3498db;
+}
+QScrollArea#changelogScroll QScrollBar:vertical {
+    background: rgba(255, 255, 255, 0.1);
+    border: none;
+    border-radius: 3px;
+    width: 6px;
+}
+QScrollArea#changelogScroll QScrollBar::handle:vertical {
+    background: rgba(255, 255, 255, 0.3);
+    border-radius: 3px;
+    min-height: 15px;
+}
+QScrollArea#changelogScroll QScrollBar::handle:vertical:hover {
+    background: rgba(255, 255, 255, 0.5);
+}
+
+QFrame#buttonsFrame {
+    background: transparent;
+}
+QPushButton#creditsButton {
+    background: rgba(149, 165, 166, 0.8);
+    color: white;
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: 8px;
+    font-weight: bold;
+    font-size: 12px;
+}
+QPushButton#creditsButton:hover {
+    background: rgba(149, 165, 166, 1.0);
+    border: 1px solid rgba(255, 255, 255, 0.4);
+}
+QPushButton#creditsButton:pressed {
+    background: rgba(127, 140, 141, 1.0);
+}
+QPushButton#closeButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #e74c3c, stop:1 #c0392b);
+    color: white;
+    border: none;
+    border-radius: 8px;
+    font-weight: bold;
+    font-size: 12px;
+}
+QPushButton#closeButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #ec7063, stop:1 #e74c3c);
+}
+QPushButton#closeButton:pressed {
+    background: #c0392b;
+}
+"""
+
+_CHANGELOG_FILE = Path(__file__).parent.parent.parent.parent / "about" / "changelog.md"
+_NO_CHANGES_HTML = "<p><i>No recent changes available.</i></p>"
+_CHANGELOG_VERSION_HTML = "<h4 style='color: #4a90e2; margin-bottom: 5px;'>{}</h4>"
+_CHANGELOG_SECTION_HTML = "<p style='margin: 3px 0; font-weight: bold;'>{}</p>"
+_CHANGELOG_ITEM_HTML = "<p style='margin: 2px 0 2px 15px; font-size: 9pt;'>• {}</p>"
+
+
+@lru_cache(maxsize=1)
+def _header_fonts():
+    """Create the header fonts once; QFont needs a QApplication, so not at import."""
+    return (
+        QFont('Segoe UI', 18, QFont.Weight.Bold),  # App name
+        QFont('Segoe UI', 10),                     # Tagline
+        QFont('Segoe UI', 9),                      # Organization
+    )
+
+
+def _changelog_html() -> str:
+    """Get the changelog HTML, re-reading the file only when it changes."""
+    try:
+        mtime_ns = os.stat(_CHANGELOG_FILE).st_mtime_ns
+    except OSError:
+        return _NO_CHANGES_HTML
+    return _load_changelog_html(str(_CHANGELOG_FILE), mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _load_changelog_html(path: str, mtime_ns: int) -> str:
+    """Load changelog.md and format its latest entries (cached per mtime)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = _parse_changelog(f)
+    except Exception as e:
+        logger.warning(f"Failed to load changelog: {e}")
+        return _NO_CHANGES_HTML
+    
+    return _format_changelog_html(entries)
+
+
+def _parse_changelog(lines, limit: int = 3):
+    """
+    Parse changelog entries (simple parsing), returning the latest `limit`.
+    
+    Lines are consumed lazily and reading stops at the header after the
+    last wanted entry, so only the top of the file is read.
+    """
+    entries = []
+    current_version = None
+    current_content = []
+    
+    for line in lines:
+        line = line.strip()
+        
+        # Version header
+        if line.startswith('## Version'):
+            if current_version and current_content:
+                entries.append({
+                    'version': current_version,
+                    'content': '\n'.join(current_content)
+                })
+                if len(entries) == limit:
+                    return entries
+            
+            current_version = line.replace('## Version ', '').strip()
+            current_content = []
+        
+        elif current_version and line:
+            current_content.append(line)
+    
+    # Add last entry
+    if current_version and current_content:
+        entries.append({
+            'version': current_version,
+            'content': '\n'.join(current_content)
+        })
+    
+    return entries
+
+
+def _format_changelog_section(line: str):
+    """Format a '### ' subsection line, or None for other '#' lines."""
+    if line.startswith('### '):
+        return _CHANGELOG_SECTION_HTML.format(line[4:])
+    return None
+
+
+def _format_changelog_item(line: str):
+    """Format a '- ' list item line, or None for other '-' lines."""
+    if line.startswith('- '):
+        return _CHANGELOG_ITEM_HTML.format(line[2:])
+    return None
+
+
+# Line formatters keyed by a line's first character
+_CHANGELOG_LINE_FORMATTERS = {
+    '#': _format_changelog_section,
+    '-': _format_changelog_item,
+}
+
+
+def _format_changelog_html(entries) -> str:
+    """Format changelog entries as HTML."""
+    if not entries:
+        return _NO_CHANGES_HTML
+    
+    html_parts = []
+    for entry in entries:
+        html_parts.append(_CHANGELOG_VERSION_HTML.format(entry['version']))
+        
+        # Subsections and list items; content lines are already stripped
+        for line in entry['content'].split('\n'):
+            formatter = _CHANGELOG_LINE_FORMATTERS.get(line[:1])
+            if formatter is not None:
+                html = formatter(line)
+                if html is not None:
+                    html_parts.append(html)
+        html_parts.append("<br>")
+    
+    return ''.join(html_parts)
+
 
 class AboutDialog(QDialog):
     """About dialog showing app info, version, and data locations."""
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(f"About {APP_NAME}")
+        self.setWindowTitle(_ABOUT_TITLE)
         self.setFixedSize(420, 380)
         self.setModal(True)
         
         # Position dialog near left edge of screen
         self.move(50, 100)
         
-        # Load changelog content
-        self.changelog_entries = self._load_changelog()
+        # Changelog HTML currently shown; filled in after the dialog paints
+        self._changelog_html = None
+        self._credits_box = None
         
         self.setup_ui()
         self.setup_connections()
     
     def setup_ui(self):
         """Setup the user interface."""
+        # Hold off repaints until every section is in place
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_sections()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _build_sections(self):
+        """Create the dialog's sections."""
         # Set modern dark gradient background
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2c3e50, stop:0.5 #34495e, stop:1 #2c3e50);
-                color: white;
-                border-radius: 12px;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
         
         layout = QVBoxLayout(self)
         layout.setSpacing(6)
@@ -77,16 +415,7 @@ class AboutDialog(QDialog):
     def create_header_section(self):
         """Create the header with app name and logo."""
         frame = QFrame()
-        frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(52, 152, 219, 0.8), stop:1 rgba(41, 128, 185, 0.9));
-                border: 2px solid rgba(255, 255, 255, 0.1);
-                border-radius: 12px;
-                padding: 15px;
-                margin: 2px;
-            }
-        """)
+        frame.setObjectName("headerFrame")
         
         layout = QHBoxLayout(frame)
         layout.setSpacing(15)
@@ -94,18 +423,7 @@ class AboutDialog(QDialog):
         # App icon with smaller size
         icon_label = QLabel()
         icon_label.setFixedSize(60, 60)
-        icon_label.setStyleSheet("""
-            QLabel {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #3498db, stop:1 #2980b9);
-                border: 2px solid rgba(255, 255, 255, 0.2);
-                border-radius: 30px;
-                color: white;
-                font-size: 22px;
-                font-weight: bold;
-                font-family: 'Segoe UI', sans-serif;
-            }
-        """)
+        icon_label.setObjectName("appIcon")
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         icon_label.setText("PJ")
         layout.addWidget(icon_label)
@@ -114,44 +432,22 @@ class AboutDialog(QDialog):
         info_layout = QVBoxLayout()
         
         # App name
+        name_font, tagline_font, org_font = _header_fonts()
         name_label = QLabel(APP_NAME)
-        name_font = QFont('Segoe UI', 18, QFont.Weight.Bold)
         name_label.setFont(name_font)
-        name_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                background: transparent;
-                border: none;
-                margin-bottom: 3px;
-            }
-        """)
+        name_label.setObjectName("appName")
         info_layout.addWidget(name_label)
         
         # Tagline
         tagline_label = QLabel("A Windows-first personal journaling application")
-        tagline_font = QFont('Segoe UI', 10)
         tagline_label.setFont(tagline_font)
-        tagline_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.9);
-                background: transparent;
-                border: none;
-                margin-bottom: 5px;
-            }
-        """)
+        tagline_label.setObjectName("appTagline")
         info_layout.addWidget(tagline_label)
         
         # Organization
         org_label = QLabel(f"© 2025 {ORG_NAME}")
-        org_font = QFont('Segoe UI', 9)
         org_label.setFont(org_font)
-        org_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.7);
-                background: transparent;
-                border: none;
-            }
-        """)
+        org_label.setObjectName("appOrg")
         info_layout.addWidget(org_label)
         
         layout.addLayout(info_layout)
@@ -162,157 +458,56 @@ class AboutDialog(QDialog):
     def create_version_section(self):
         """Create version and build information section."""
         group = QGroupBox("Version Information")
-        group.setStyleSheet("""
-            QGroupBox {
-                background: rgba(44, 62, 80, 0.6);
-                border: 2px solid rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-                padding: 8px;
-                margin-top: 5px;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 6px 0 6px;
-                color: rgba(255, 255, 255, 0.9);
-            }
-        """)
-        layout = QVBoxLayout(group)
-        layout.setContentsMargins(6, 4, 6, 6)
-        
-        # Version details with compact styling
-        version_text = f"""
-<table cellpadding="4" cellspacing="0" style="width: 100%; color: rgba(255, 255, 255, 0.9);">
-<tr><td style="font-weight: bold; color: #3498db; font-size: 11px;">Version:</td><td style="font-size: 11px;">{VERSION}</td></tr>
-<tr><td style="font-weight: bold; color: #3498db; font-size: 11px;">Build Date:</td><td style="font-size: 11px;">{BUILD_DATE}</td></tr>
-<tr><td style="font-weight: bold; color: #3498db; font-size: 11px;">Channel:</td><td style="font-size: 11px;">{CHANNEL.title()}</td></tr>
-<tr><td style="font-weight: bold; color: #3498db; font-size: 11px;">Full Version:</td><td style="font-size: 11px;">{get_version_string()}</td></tr>
-</table>
-        """.strip()
-        
-        version_label = QLabel(version_text)
-        version_label.setWordWrap(True)
-        version_label.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                border: none;
-                color: white;
-                font-size: 11px;
-            }
-        """)
-        layout.addWidget(version_label)
+        group.setObjectName("versionGroup")
+        layout = QGridLayout(group)
+        layout.setContentsMargins(10, 4, 10, 6)
+        layout.setHorizontalSpacing(8)
+        layout.setVerticalSpacing(4)
+        layout.setColumnStretch(1, 1)
+        
+        # Version details as plain-text key/value labels
+        for row, (key, value) in enumerate(_VERSION_ROWS):
+            key_label = QLabel(key)
+            key_label.setObjectName("versionKey")
+            key_label.setTextFormat(Qt.TextFormat.PlainText)
+            value_label = QLabel(value)
+            value_label.setTextFormat(Qt.TextFormat.PlainText)
+            layout.addWidget(key_label, row, 0)
+            layout.addWidget(value_label, row, 1)
         
         return group
     
     def create_data_locations_section(self):
         """Create data locations section with open buttons."""
         group = QGroupBox("Data Locations")
-        group.setStyleSheet("""
-            QGroupBox {
-                background: rgba(44, 62, 80, 0.6);
-                border: 2px solid rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-                padding: 8px;
-                margin-top: 5px;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 6px 0 6px;
-                color: rgba(255, 255, 255, 0.9);
-            }
-        """)
+        group.setObjectName("dataGroup")
         layout = QVBoxLayout(group)
         layout.setContentsMargins(6, 4, 6, 6)
         
-        # Get data directories
-        from ..settings import get_setting
-        from platformdirs import user_data_dir, user_config_dir
-        from ..app_meta import APP_NAME, ORG_NAME
-        
-        data_dir = user_data_dir(APP_NAME, ORG_NAME)
-        config_dir = user_config_dir(APP_NAME, ORG_NAME)
-        
         # Data directory
         data_layout = QHBoxLayout()
-        data_label = QLabel(f"<b style='color: #3498db; font-size: 11px;'>Data Directory:</b><br><span style='color: rgba(255,255,255,0.8); font-size: 10px;'>{data_dir}</span>")
+        data_label = QLabel(f"<b style='color: #3498db; font-size: 11px;'>Data Directory:</b><br><span style='color: rgba(255,255,255,0.8); font-size: 10px;'>{_DATA_DIR}</span>")
         data_label.setWordWrap(True)
-        data_label.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                border: none;
-                color: white;
-                padding: 3px;
-                font-size: 10px;
-            }
-        """)
+        data_label.setObjectName("pathLabel")
         data_layout.addWidget(data_label)
         
         self.open_data_btn = QPushButton("Open")
         self.open_data_btn.setFixedSize(50, 24)
-        self.open_data_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3498db, stop:1 #2980b9);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5dade2, stop:1 #3498db);
-            }
-            QPushButton:pressed {
-                background: #2980b9;
-            }
-        """)
+        self.open_data_btn.setObjectName("openButton")
         self.open_data_btn.setToolTip("Open data directory in file explorer")
         data_layout.addWidget(self.open_data_btn)
         layout.addLayout(data_layout)
         
         # Config directory
         config_layout = QHBoxLayout()
-        config_label = QLabel(f"<b style='color: #3498db; font-size: 11px;'>Config Directory:</b><br><span style='color: rgba(255,255,255,0.8); font-size: 10px;'>{config_dir}</span>")
+        config_label = QLabel(f"<b style='color: #3498db; font-size: 11px;'>Config Directory:</b><br><span style='color: rgba(255,255,255,0.8); font-size: 10px;'>{_CONFIG_DIR}</span>")
         config_label.setWordWrap(True)
-        config_label.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                border: none;
-                color: white;
-                padding: 3px;
-                font-size: 10px;
-            }
-        """)
+        config_label.setObjectName("pathLabel")
         config_layout.addWidget(config_label)
         
         self.open_config_btn = QPushButton("Open")
         self.open_config_btn.setFixedSize(50, 24)
-        self.open_config_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3498db, stop:1 #2980b9);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5dade2, stop:1 #3498db);
-            }
-            QPushButton:pressed {
-                background: #2980b9;
-            }
-        """)
+        self.open_config_btn.setObjectName("openButton")
         self.open_config_btn.setToolTip("Open config directory in file explorer")
         config_layout.addWidget(self.open_config_btn)
         layout.addLayout(config_layout)
@@ -322,93 +517,41 @@ class AboutDialog(QDialog):
     def create_changelog_section(self):
         """Create changelog section showing recent entries."""
         group = QGroupBox("Recent Changes")
-        group.setStyleSheet("""
-            QGroupBox {
-                background: rgba(44, 62, 80, 0.6);
-                border: 2px solid rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-                padding: 8px;
-                margin-top: 5px;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 8px;
-                padding: 0 6px 0 6px;
-                color: rgba(255, 255, 255, 0.9);
-            }
-        """)
+        group.setObjectName("changelogGroup")
         layout = QVBoxLayout(group)
         layout.setContentsMargins(6, 4, 6, 6)
         
-        # Changelog text area
-        self.changelog_text = QTextEdit()
-        self.changelog_text.setMaximumHeight(50)
-        self.changelog_text.setReadOnly(True)
-        self.changelog_text.setStyleSheet("""
-            QTextEdit {
-                background: rgba(52, 73, 94, 0.7);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 6px;
-                color: white;
-                font-family: 'Segoe UI', sans-serif;
-                font-size: 10px;
-                padding: 6px;
-                selection-background-color: #3498db;
-            }
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                border: none;
-                border-radius: 3px;
-                width: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.3);
-                border-radius: 3px;
-                min-height: 15px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.5);
-            }
-        """)
-        
-        # Load and display changelog
-        changelog_html = self._format_changelog_html()
-        self.changelog_text.setHtml(changelog_html)
-        
-        layout.addWidget(self.changelog_text)
+        # Changelog text: a rich-text label is all a read-only view needs,
+        # wrapped in a scroll area for entries taller than the box
+        self.changelog_text = QLabel()
+        self.changelog_text.setObjectName("changelogText")
+        self.changelog_text.setTextFormat(Qt.TextFormat.RichText)
+        self.changelog_text.setWordWrap(True)
+        self.changelog_text.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        self.changelog_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+        
+        changelog_scroll = QScrollArea()
+        changelog_scroll.setMaximumHeight(50)
+        changelog_scroll.setWidgetResizable(True)
+        changelog_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        changelog_scroll.setObjectName("changelogScroll")
+        changelog_scroll.setWidget(self.changelog_text)
+        
+        layout.addWidget(changelog_scroll)
         
         return group
     
     def create_buttons_section(self):
         """Create the bottom buttons section."""
         frame = QFrame()
-        frame.setStyleSheet("background: transparent;")
+        frame.setObjectName("buttonsFrame")
         layout = QHBoxLayout(frame)
         layout.setContentsMargins(0, 10, 0, 0)
         
         # Credits button
         self.credits_btn = QPushButton("Credits")
         self.credits_btn.setFixedSize(80, 30)
-        self.credits_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(149, 165, 166, 0.8);
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: rgba(149, 165, 166, 1.0);
-                border: 1px solid rgba(255, 255, 255, 0.4);
-            }
-            QPushButton:pressed {
-                background: rgba(127, 140, 141, 1.0);
-            }
-        """)
+        self.credits_btn.setObjectName("creditsButton")
         self.credits_btn.setToolTip("Show credits and acknowledgments")
         layout.addWidget(self.credits_btn)
         
@@ -418,28 +561,25 @@ class AboutDialog(QDialog):
         self.close_btn = QPushButton("Close")
         self.close_btn.setDefault(True)
         self.close_btn.setFixedSize(80, 30)
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e74c3c, stop:1 #c0392b);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ec7063, stop:1 #e74c3c);
-            }
-            QPushButton:pressed {
-                background: #c0392b;
-            }
-        """)
+        self.close_btn.setObjectName("closeButton")
         layout.addWidget(self.close_btn)
         
         return frame
     
+    def showEvent(self, event):
+        """Load the changelog once the dialog is on screen."""
+        super().showEvent(event)
+        # Deferred so the file read and rich-text layout don't hold up the
+        # first paint
+        QTimer.singleShot(0, self._refresh_changelog)
+    
+    def _refresh_changelog(self):
+        """Show the current changelog, if it differs from what is shown."""
+        html = _changelog_html()
+        if html != self._changelog_html:
+            self._changelog_html = html
+            self.changelog_text.setText(html)
+    
     def setup_connections(self):
         """Setup signal connections."""
         self.open_data_btn.clicked.connect(self.open_data_directory)
@@ -447,94 +587,14 @@ class AboutDialog(QDialog):
         self.credits_btn.clicked.connect(self.show_credits)
         self.close_btn.clicked.connect(self.accept)
     
-    def _load_changelog(self):
-        """Load changelog entries from about/changelog.md."""
-        changelog_file = Path(__file__).parent.parent.parent.parent / "about" / "changelog.md"
-        
-        if not changelog_file.exists():
-            return []
-        
-        try:
-            with open(changelog_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse changelog entries (simple parsing)
-            entries = []
-            current_version = None
-            current_content = []
-            
-            for line in content.split('\n'):
-                line = line.strip()
-                
-                # Version header
-                if line.startswith('## Version'):
-                    if current_version and current_content:
-                        entries.append({
-                            'version': current_version,
-                            'content': '\n'.join(current_content)
-                        })
-                    
-                    current_version = line.replace('## Version ', '').strip()
-                    current_content = []
-                
-                elif current_version and line:
-                    current_content.append(line)
-            
-            # Add last entry
-            if current_version and current_content:
-                entries.append({
-                    'version': current_version,
-                    'content': '\n'.join(current_content)
-                })
-            
-            return entries[:3]  # Return latest 3 entries
-            
-        except Exception as e:
-            logger.warning(f"Failed to load changelog: {e}")
-            return []
-    
-    def _format_changelog_html(self):
-        """Format changelog entries as HTML."""
-        if not self.changelog_entries:
-            return "<p><i>No recent changes available.</i></p>"
-        
-        html_parts = []
-        
-        for entry in self.changelog_entries:
-            version = entry['version']
-            content = entry['content']
-            
-            # Format version header
-            html_parts.append(f"<h4 style='color: #4a90e2; margin-bottom: 5px;'>{version}</h4>")
-            
-            # Format content
-            lines = content.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('### '):
-                    # Subsection
-                    html_parts.append(f"<p style='margin: 3px 0; font-weight: bold;'>{line[4:]}</p>")
-                elif line.startswith('- '):
-                    # List item
-                    html_parts.append(f"<p style='margin: 2px 0 2px 15px; font-size: 9pt;'>• {line[2:]}</p>")
-            
-            html_parts.append("<br>")
-        
-        return ''.join(html_parts)
-    
     def open_data_directory(self):
         """Open the data directory in file explorer."""
         try:
-            from platformdirs import user_data_dir
-            from ..app_meta import APP_NAME, ORG_NAME
-            
-            data_dir = user_data_dir(APP_NAME, ORG_NAME)
-            
             # Ensure directory exists
-            os.makedirs(data_dir, exist_ok=True)
+            _ensure_dir(_DATA_DIR)
             
             # Open in file explorer
-            QDesktopServices.openUrl(QUrl.fromLocalFile(str(data_dir)))
+            QDesktopServices.openUrl(QUrl.fromLocalFile(_DATA_DIR))
             
         except Exception as e:
             logger.error(f"Failed to open data directory: {e}")
@@ -542,56 +602,39 @@ class AboutDialog(QDialog):
     def open_config_directory(self):
         """Open the config directory in file explorer."""
         try:
-            from platformdirs import user_config_dir
-            from ..app_meta import APP_NAME, ORG_NAME
-            
-            config_dir = user_config_dir(APP_NAME, ORG_NAME)
-            
             # Ensure directory exists
-            os.makedirs(config_dir, exist_ok=True)
+            _ensure_dir(_CONFIG_DIR)
             
             # Open in file explorer
-            QDesktopServices.openUrl(QUrl.fromLocalFile(str(config_dir)))
+            QDesktopServices.openUrl(QUrl.fromLocalFile(_CONFIG_DIR))
             
         except Exception as e:
             logger.error(f"Failed to open config directory: {e}")
     
     def show_credits(self):
         """Show credits and acknowledgments."""
-        credits_text = f"""
-<h3>Credits & Acknowledgments</h3>
+        # Built on first use and kept for later clicks
+        if self._credits_box is None:
+            self._credits_box = QMessageBox(self)
+            self._credits_box.setWindowTitle("Credits")
+            self._credits_box.setText(_CREDITS_HTML)
+            self._credits_box.setIcon(QMessageBox.Icon.Information)
+        self._credits_box.exec()
 
-<p><b>{APP_NAME}</b> is built with the following technologies:</p>
 
-<ul>
-<li><b>PySide6</b> - Modern Qt bindings for Python</li>
-<li><b>Python</b> - The programming language</li>
-<li><b>PyYAML</b> - YAML parsing and generation</li>
-<li><b>platformdirs</b> - Cross-platform data directories</li>
-<li><b>markdown-it-py</b> - Markdown processing</li>
-<li><b>pytest</b> - Testing framework</li>
-</ul>
-
-<p><b>Special Thanks:</b></p>
-<ul>
-<li>The Qt Company for the excellent Qt framework</li>
-<li>The Python Software Foundation</li>
-<li>All open source contributors</li>
-</ul>
-
-<p><b>Development:</b><br>
-Built with love for personal productivity and journaling.</p>
-        """
-        
-        from PySide6.QtWidgets import QMessageBox
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Credits")
-        msg.setText(credits_text)
-        msg.setIcon(QMessageBox.Icon.Information)
-        msg.exec()
+# The one AboutDialog, reused by every show_about_dialog call
+_INSTANCE = None
 
 
 def show_about_dialog(parent=None):
     """Show the about dialog."""
-    dialog = AboutDialog(parent)
-    return dialog.exec()
\ No newline at end of file
+    global _INSTANCE
+    
+    # Qt deletes the dialog along with its parent, so check it is still alive
+    if _INSTANCE is None or not isValid(_INSTANCE):
+        _INSTANCE = AboutDialog(parent)
+    elif _INSTANCE.parent() is not parent:
+        # Passing the flags keeps it a top-level dialog after reparenting
+        _INSTANCE.setParent(parent, _INSTANCE.windowFlags())
+    
+    return _INSTANCE.exec()
\ No newline at end of file
@@ -9,6 +9,7 @@ This module provides the primary note-taking interface with:
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -18,7 +19,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import (
     Qt, QPropertyAnimation, QRect, QSize, QEasingCurve, QTimer, QPoint,
-    Signal, QParallelAnimationGroup
+    Signal, Slot, QParallelAnimationGroup
 )
 from PySide6.QtGui import (
     QFont, QTextCursor, QKeySequence, QShortcut, QIcon, QPixmap, 
@@ -30,16 +31,195 @@ from ..app_meta import APP_NAME
 from ..core.autosave import AutosaveManager, EntryLifecycleManager
 from ..core.smart_formatting import SmartFormatter, TitleSubtitleExtractor
 from .formatting_toolbar import SmartFormattingToolbar
-from .entry_actions import EntryActionsManager, open_data_folder
+from .entry_actions import EntryActionsManager
 
 logger = logging.getLogger(__name__)
 
+# Minimum spacing between content_changed notifications while typing
+_CHANGE_NOTIFY_MS = 250
+
+# Status bar clock, US format
+_TIME_FORMAT = "%m/%d/%Y %I:%M %p"
+
+# Top bar buttons as (icon name, tooltip), either side of the spacer
+_TOP_BAR_LEFT = (
+    ("back", "Back/Recent entries"),
+    ("search", "Search entries (Ctrl+K)"),
+    ("export", "Export entry"),
+    ("tags", "Manage tags"),
+    ("more", "More entry actions"),
+)
+_TOP_BAR_RIGHT = (
+    ("settings", "Settings"),
+    ("help", "Help (F1)"),
+)
+
+# Panel shortcuts as (key sequence, signal or slot it triggers)
+_PANEL_SHORTCUTS = (
+    ("Ctrl+N", "new_entry_requested"),  # new entry
+    ("Ctrl+S", "_manual_save"),         # manual save
+    ("Ctrl+K", "search_requested"),     # search
+    ("F1", "help_requested"),           # help
+    ("Escape", "collapse_requested"),   # close
+)
+
+# Chrome for the panel, its bars, icon buttons and editor. Installed on the application
+# once, so panels and their widgets don't each parse their own stylesheet.
+_PANEL_QSS = """
+IntegratedEditorPanel {
+    background-color: #ffffff;
+    border: 1px solid #dee2e6;
+    border-radius: 8px;
+}
+CompactTopBar {
+    background-color: #f8f9fa;
+    border-bottom: 1px solid #e9ecef;
+}
+CompactStatusBar {
+    background-color: #ffffff;
+    border-top: 1px solid #e9ecef;
+}
+IconButton {
+    border: none;
+    border-radius: 4px;
+    padding: 2px;
+    background-color: transparent;
+}
+IconButton:hover {
+    background-color: rgba(0, 0, 0, 0.08);
+}
+IconButton:pressed {
+    background-color: rgba(0, 0, 0, 0.15);
+}
+QLabel#autosaveLabel {
+    color: #28a745;
+    font-weight: bold;
+    font-size: 10px;
+}
+QLabel#autosaveLabel[state="saving"] {
+    color: #ffc107;
+}
+QLabel#timeLabel {
+    color: #6c757d;
+    font-size: 9px;
+    font-family: 'Segoe UI', sans-serif;
+}
+QTextEdit#panelEditor {
+    border: none;
+    background-color: #ffffff;
+    padding: 8px;
+    selection-background-color: #007acc;
+    selection-color: white;
+}
+"""
+
+_stylesheet_installed = False
+
+
+def _install_stylesheet():
+    """Append the panel stylesheet to the application's, once per process."""
+    global _stylesheet_installed
+    if _stylesheet_installed:
+        return
+    app = QApplication.instance()
+    if app is None:
+        return
+    app.setStyleSheet(app.styleSheet() + _PANEL_QSS)
+    _stylesheet_installed = True
+
+
+@lru_cache(maxsize=None)
+def _editor_font(family: str, size: int) -> QFont:
+    """Resolve the editor font once per family and size."""
+    return QFont(family, size)
+
+
+@lru_cache(maxsize=None)
+def _render_icon(icon_name: str) -> QIcon:
+    """Draw the named top bar icon; each name is painted once and shared."""
+    size = 16
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    
+    # Set color
+    color = QColor(90, 90, 90)
+    painter.setPen(QPen(color, 1.5))
+    painter.setBrush(QBrush(color))
+    
+    # Draw different icons based on name
+    center = size // 2
+    
+    if icon_name == "back":
+        # Left arrow
+        painter.drawLine(center + 2, center - 3, center - 1, center)
+        painter.drawLine(center - 1, center, center + 2, center + 3)
+        painter.drawLine(center - 1, center, center + 4, center)
+        
+    elif icon_name == "search":
+        # Magnifying glass
+        painter.drawEllipse(center - 3, center - 3, 5, 5)
+        painter.drawLine(center + 1, center + 1, center + 3, center + 3)
+        
+    elif icon_name == "export":
+        # Upload arrow
+        painter.drawLine(center, center - 3, center, center + 2)
+        painter.drawLine(center, center - 3, center - 2, center - 1)
+        painter.drawLine(center, center - 3, center + 2, center - 1)
+        painter.drawRect(center - 3, center + 1, 6, 1)
+        
+    elif icon_name == "tags":
+        # Tag icon
+        painter.drawRect(center - 3, center - 1, 4, 3)
+        painter.drawLine(center + 1, center - 1, center + 3, center + 1)
+        painter.drawLine(center + 3, center + 1, center + 1, center + 2)
+        painter.drawEllipse(center - 1, center, 1, 1)
+        
+    elif icon_name == "more":
+        # Three dots
+        painter.drawEllipse(center - 4, center, 1, 1)
+        painter.drawEllipse(center, center, 1, 1)
+        painter.drawEllipse(center + 3, center, 1, 1)
+        
+    elif icon_name == "settings":
+        # Gear icon (simplified)
+        painter.drawEllipse(center - 2, center - 2, 4, 4)
+        painter.drawEllipse(center - 1, center - 1, 2, 2)
+        for i in range(6):
+            angle = i * 60
+            painter.save()
+            painter.translate(center, center)
+            painter.rotate(angle)
+            painter.drawRect(0, -4, 1, 1)
+            painter.restore()
+            
+    elif icon_name == "help":
+        # Question mark
+        painter.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "?")
+        
+    elif icon_name == "egg":
+        # Easter egg icon
+        painter.drawEllipse(center - 2, center - 3, 4, 6)
+        painter.setPen(QPen(QColor(255, 200, 0), 1))
+        painter.drawEllipse(center - 1, center - 1, 1, 1)
+        
+    else:
+        # Default icon (square)
+        painter.drawRect(center - 2, center - 2, 4, 4)
+    
+    painter.end()
+    return QIcon(pixmap)
+
 
 class IconButton(QToolButton):
     """Compact icon button for the top bar."""
     
     def __init__(self, icon_name: str, tooltip: str, size: int = 24, parent=None):
         super().__init__(parent)
+        _install_stylesheet()
         
         self.icon_name = icon_name
         self.setToolTip(tooltip)
@@ -49,100 +229,10 @@ class IconButton(QToolButton):
         
         # Create icon
         self.setIcon(self._create_icon())
-        
-        # Style the button
-        self.setStyleSheet("""
-            QToolButton {
-                border: none;
-                border-radius: 4px;
-                padding: 2px;
-                background-color: transparent;
-            }
-            QToolButton:hover {
-                background-color: rgba(0, 0, 0, 0.08);
-            }
-            QToolButton:pressed {
-                background-color: rgba(0, 0, 0, 0.15);
-            }
-        """)
     
     def _create_icon(self) -> QIcon:
         """Create a simple icon based on the icon name."""
-        size = 16
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Set color
-        color = QColor(90, 90, 90)
-        painter.setPen(QPen(color, 1.5))
-        painter.setBrush(QBrush(color))
-        
-        # Draw different icons based on name
-        center = size // 2
-        
-        if self.icon_name == "back":
-            # Left arrow
-            painter.drawLine(center + 2, center - 3, center - 1, center)
-            painter.drawLine(center - 1, center, center + 2, center + 3)
-            painter.drawLine(center - 1, center, center + 4, center)
-            
-        elif self.icon_name == "search":
-            # Magnifying glass
-            painter.drawEllipse(center - 3, center - 3, 5, 5)
-            painter.drawLine(center + 1, center + 1, center + 3, center + 3)
-            
-        elif self.icon_name == "export":
-            # Upload arrow
-            painter.drawLine(center, center - 3, center, center + 2)
-            painter.drawLine(center, center - 3, center - 2, center - 1)
-            painter.drawLine(center, center - 3, center + 2, center - 1)
-            painter.drawRect(center - 3, center + 1, 6, 1)
-            
-        elif self.icon_name == "tags":
-            # Tag icon
-            painter.drawRect(center - 3, center - 1, 4, 3)
-            painter.drawLine(center + 1, center - 1, center + 3, center + 1)
-            painter.drawLine(center + 3, center + 1, center + 1, center + 2)
-            painter.drawEllipse(center - 1, center, 1, 1)
-            
-        elif self.icon_name == "more":
-            # Three dots
-            painter.drawEllipse(center - 4, center, 1, 1)
-            painter.drawEllipse(center, center, 1, 1)
-            painter.drawEllipse(center + 3, center, 1, 1)
-            
-        elif self.icon_name == "settings":
-            # Gear icon (simplified)
-            painter.drawEllipse(center - 2, center - 2, 4, 4)
-            painter.drawEllipse(center - 1, center - 1, 2, 2)
-            for i in range(6):
-                angle = i * 60
-                painter.save()
-                painter.translate(center, center)
-                painter.rotate(angle)
-                painter.drawRect(0, -4, 1, 1)
-                painter.restore()
-                
-        elif self.icon_name == "help":
-            # Question mark
-            painter.setFont(QFont("Arial", 9, QFont.Weight.Bold))
-            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "?")
-            
-        elif self.icon_name == "egg":
-            # Easter egg icon
-            painter.drawEllipse(center - 2, center - 3, 4, 6)
-            painter.setPen(QPen(QColor(255, 200, 0), 1))
-            painter.drawEllipse(center - 1, center - 1, 1, 1)
-            
-        else:
-            # Default icon (square)
-            painter.drawRect(center - 2, center - 2, 4, 4)
-        
-        painter.end()
-        return QIcon(pixmap)
+        return _render_icon(self.icon_name)
 
 
 class CompactTopBar(QWidget):
@@ -159,6 +249,7 @@ class CompactTopBar(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        _install_stylesheet()
         self.setup_ui()
         self.setup_connections()
     
@@ -169,52 +260,34 @@ class CompactTopBar(QWidget):
         layout.setSpacing(2)
         
         # Left side icons
-        self.back_btn = IconButton("back", "Back/Recent entries", 24)
-        self.search_btn = IconButton("search", "Search entries (Ctrl+K)", 24)
-        self.export_btn = IconButton("export", "Export entry", 24)
-        self.tags_btn = IconButton("tags", "Manage tags", 24)
-        self.more_btn = IconButton("more", "More entry actions", 24)
-        
-        layout.addWidget(self.back_btn)
-        layout.addWidget(self.search_btn)
-        layout.addWidget(self.export_btn)
-        layout.addWidget(self.tags_btn)
-        layout.addWidget(self.more_btn)
+        for name, tooltip in _TOP_BAR_LEFT:
+            layout.addWidget(self._create_button(name, tooltip))
         
         # Spacer
         layout.addStretch()
         
-        # Right side icons
-        self.settings_btn = IconButton("settings", "Settings", 24)
-        self.help_btn = IconButton("help", "Help (F1)", 24)
-        
         # Easter egg icon (conditional)
         self.egg_btn = IconButton("egg", "Easter egg", 24)
         self.egg_btn.setVisible(get_setting("show_egg_icon", False))
-        
         layout.addWidget(self.egg_btn)
-        layout.addWidget(self.settings_btn)
-        layout.addWidget(self.help_btn)
         
-        # Style the top bar
-        self.setStyleSheet("""
-            CompactTopBar {
-                background-color: #f8f9fa;
-                border-bottom: 1px solid #e9ecef;
-            }
-        """)
+        # Right side icons
+        for name, tooltip in _TOP_BAR_RIGHT:
+            layout.addWidget(self._create_button(name, tooltip))
         
         self.setFixedHeight(30)
     
+    def _create_button(self, name: str, tooltip: str) -> IconButton:
+        """Create the icon button stored as ``<name>_btn``."""
+        button = IconButton(name, tooltip, 24)
+        setattr(self, f"{name}_btn", button)
+        return button
+    
     def setup_connections(self):
         """Setup signal connections."""
-        self.back_btn.clicked.connect(self.back_clicked.emit)
-        self.search_btn.clicked.connect(self.search_clicked.emit)
-        self.export_btn.clicked.connect(self.export_clicked.emit)
-        self.tags_btn.clicked.connect(self.tags_clicked.emit)
-        self.more_btn.clicked.connect(self.more_clicked.emit)
-        self.settings_btn.clicked.connect(self.settings_clicked.emit)
-        self.help_btn.clicked.connect(self.help_clicked.emit)
+        # Each button relays straight into the bar's <name>_clicked signal
+        for name, _ in _TOP_BAR_LEFT + _TOP_BAR_RIGHT:
+            getattr(self, f"{name}_btn").clicked.connect(getattr(self, f"{name}_clicked"))
     
     def update_egg_icon_visibility(self):
         """Update easter egg icon visibility."""
@@ -225,8 +298,14 @@ class CompactTopBar(QWidget):
 class CompactStatusBar(QWidget):
     """Compact status bar with autosave indicator and time."""
     
+    # Autosave indicator states, styled by the shared panel stylesheet
+    _SAVING_STATE = "saving"
+    _IDLE_STATE = "idle"
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        _install_stylesheet()
+        self._shown_minute = None  # minute currently on the clock
         self.setup_ui()
         self.setup_timer()
     
@@ -237,13 +316,8 @@ class CompactStatusBar(QWidget):
         
         # Autosave status
         self.autosave_label = QLabel("●")
-        self.autosave_label.setStyleSheet("""
-            QLabel {
-                color: #28a745;
-                font-weight: bold;
-                font-size: 10px;
-            }
-        """)
+        self.autosave_label.setObjectName("autosaveLabel")
+        self.autosave_label.setProperty("state", self._IDLE_STATE)
         self.autosave_label.setToolTip("Autosave active")
         
         # Spacer
@@ -251,62 +325,61 @@ class CompactStatusBar(QWidget):
         
         # Time display
         self.time_label = QLabel()
-        self.time_label.setStyleSheet("""
-            QLabel {
-                color: #6c757d;
-                font-size: 9px;
-                font-family: 'Segoe UI', sans-serif;
-            }
-        """)
+        self.time_label.setObjectName("timeLabel")
         
         layout.addWidget(self.autosave_label)
         layout.addWidget(self.time_label)
         
-        # Style the status bar
-        self.setStyleSheet("""
-            CompactStatusBar {
-                background-color: #ffffff;
-                border-top: 1px solid #e9ecef;
-            }
-        """)
-        
         self.setFixedHeight(18)
         self.update_time()
     
     def setup_timer(self):
-        """Setup timer for updating time."""
-        self.timer = QTimer()
+        """Setup timer for updating time; it only runs while the bar is shown."""
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)  # re-armed for each minute boundary
         self.timer.timeout.connect(self.update_time)
-        self.timer.start(30000)  # Update every 30 seconds
     
+    def showEvent(self, event):
+        """Refresh the clock and keep it ticking while visible."""
+        super().showEvent(event)
+        self.update_time()
+    
+    def hideEvent(self, event):
+        """Stop the clock while hidden (e.g. the panel is collapsed)."""
+        super().hideEvent(event)
+        self.timer.stop()
+    
+    @Slot()
     def update_time(self):
-        """Update time display in US format."""
+        """Update time display in US format, then wait for the next minute."""
         now = datetime.now()
-        time_str = now.strftime("%m/%d/%Y %I:%M %p")
-        self.time_label.setText(time_str)
+        minute = now.replace(second=0, microsecond=0)
+        if minute != self._shown_minute:
+            self._shown_minute = minute
+            self.time_label.setText(now.strftime(_TIME_FORMAT))
+        
+        if self.isVisible():
+            self.timer.start(60000 - now.second * 1000 - now.microsecond // 1000)
     
+    @Slot(bool)
     def set_autosave_status(self, saving: bool):
         """Update autosave status."""
         if saving:
             self.autosave_label.setText("⚬")
-            self.autosave_label.setStyleSheet("""
-                QLabel {
-                    color: #ffc107;
-                    font-weight: bold;
-                    font-size: 10px;
-                }
-            """)
             self.autosave_label.setToolTip("Saving...")
         else:
             self.autosave_label.setText("●")
-            self.autosave_label.setStyleSheet("""
-                QLabel {
-                    color: #28a745;
-                    font-weight: bold;
-                    font-size: 10px;
-                }
-            """)
             self.autosave_label.setToolTip("Autosave active")
+        
+        # Flip the color through the shared stylesheet instead of a new one;
+        # only repolish when the state actually changes
+        state = self._SAVING_STATE if saving else self._IDLE_STATE
+        if self.autosave_label.property("state") == state:
+            return
+        self.autosave_label.setProperty("state", state)
+        style = self.autosave_label.style()
+        style.unpolish(self.autosave_label)
+        style.polish(self.autosave_label)
     
     def set_last_save_time(self, save_time: str):
         """Update autosave tooltip with last save time."""
@@ -334,7 +407,7 @@ class IntegratedEditorPanel(QWidget):
     
     # Signals
     collapse_requested = Signal()
-    content_changed = Signal(str)
+    content_changed = Signal()       # text is pulled via get_content()
     new_entry_requested = Signal()
     save_requested = Signal()
     search_requested = Signal()
@@ -348,6 +421,7 @@ class IntegratedEditorPanel(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        _install_stylesheet()
         
         # Size configuration
         self.target_width = get_setting("editor_panel.width", 480)
@@ -356,24 +430,43 @@ class IntegratedEditorPanel(QWidget):
         self.collapsed_size = QSize(48, 48)
         self.corner_position = "bottom_right"
         
+        # Animations, built once and re-targeted on each expand/collapse
+        self.expand_animation = QPropertyAnimation(self, b"geometry", self)
+        self.expand_animation.setDuration(300)
+        self.expand_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.expand_animation.finished.connect(self._on_expand_finished)
+        
+        self.collapse_animation = QPropertyAnimation(self, b"geometry", self)
+        self.collapse_animation.setDuration(300)
+        self.collapse_animation.setEasingCurve(QEasingCurve.Type.InCubic)
+        self.collapse_animation.finished.connect(self._on_collapse_finished)
+        
         # Animation state
-        self.expand_animation = None
-        self.collapse_animation = None
         self.is_expanded = False
         
+        # content_changed is coalesced so a burst of typing notifies listeners
+        # at most once per interval instead of once per keystroke
+        self._change_notify_timer = QTimer(self)
+        self._change_notify_timer.setSingleShot(True)
+        self._change_notify_timer.timeout.connect(self.content_changed)
+        
+        # Primary screen geometry, cached until the screen setup changes
+        self._screen_geometry = None
+        self._watched_screen = None
+        QApplication.instance().primaryScreenChanged.connect(self._invalidate_screen_geometry)
+        
         # Initialize systems (will be set up after UI)
         self.autosave_manager = None
         self.lifecycle_manager = None
         self.smart_formatter = None
         self.title_subtitle_extractor = None
-        self.entry_actions_manager = None
+        self._entry_actions_manager = None  # see entry_actions_manager
         self.current_toast = None  # For undo toasts
         
         # Setup UI and functionality
         self.setup_ui()
         self.setup_smart_formatting()
         self.setup_autosave_system()
-        self.setup_entry_actions()
         self.setup_shortcuts()
         self.setup_connections()
         
@@ -412,15 +505,6 @@ class IntegratedEditorPanel(QWidget):
         # Status bar
         self.status_bar = CompactStatusBar()
         layout.addWidget(self.status_bar)
-        
-        # Apply styling
-        self.setStyleSheet("""
-            IntegratedEditorPanel {
-                background-color: #ffffff;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-            }
-        """)
     
     def setup_text_editor(self):
         """Setup the main text editor."""
@@ -433,22 +517,13 @@ class IntegratedEditorPanel(QWidget):
         # Ensure font_family is a string for testing
         if isinstance(font_family, int):
             font_family = "Segoe UI"
-        font = QFont(font_family, font_size)
-        self.text_editor.setFont(font)
+        self.text_editor.setFont(_editor_font(font_family, font_size))
         
         # Word wrap
         self.text_editor.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
         
         # Styling with subtle padding
-        self.text_editor.setStyleSheet("""
-            QTextEdit {
-                border: none;
-                background-color: #ffffff;
-                padding: 8px;
-                selection-background-color: #007acc;
-                selection-color: white;
-            }
-        """)
+        self.text_editor.setObjectName("panelEditor")
         
         # Cursor width
         self.text_editor.setCursorWidth(2)
@@ -462,10 +537,16 @@ class IntegratedEditorPanel(QWidget):
         # Connect content changes
         self.text_editor.textChanged.connect(self._on_text_changed)
     
+    @property
+    def entry_actions_manager(self) -> EntryActionsManager:
+        """Entry actions manager, built the first time an action is needed."""
+        if self._entry_actions_manager is None:
+            self._entry_actions_manager = EntryActionsManager()
+            self.setup_entry_actions()
+        return self._entry_actions_manager
+    
     def setup_entry_actions(self):
-        """Setup entry actions manager and toast display."""
-        self.entry_actions_manager = EntryActionsManager()
-        
+        """Connect the entry actions manager and toast display."""
         # Connect entry actions signals
         self.entry_actions_manager.entry_renamed.connect(self._on_entry_renamed)
         self.entry_actions_manager.entry_duplicated.connect(self._on_entry_duplicated)
@@ -502,6 +583,7 @@ class IntegratedEditorPanel(QWidget):
             self.current_toast.setParent(None)
             self.current_toast = None
     
+    @Slot(str, str)
     def _on_entry_renamed(self, old_path: str, new_path: str):
         """Handle entry renamed."""
         logger.info(f"Entry renamed: {old_path} -> {new_path}")
@@ -510,15 +592,18 @@ class IntegratedEditorPanel(QWidget):
             self.autosave_manager.current_entry.metadata.path == old_path):
             self.autosave_manager.current_entry.metadata.path = new_path
     
+    @Slot(str)
     def _on_entry_duplicated(self, new_path: str):
         """Handle entry duplicated."""
         logger.info(f"Entry duplicated: {new_path}")
         QMessageBox.information(self, "Entry Duplicated", f"Entry duplicated successfully!")
     
+    @Slot(str, str)
     def _on_entry_exported(self, source_path: str, destination: str):
         """Handle entry exported."""
         logger.info(f"Entry exported: {source_path} -> {destination}")
     
+    @Slot(str)
     def _on_entry_deleted(self, deleted_path: str):
         """Handle entry deleted."""
         logger.info(f"Entry deleted: {deleted_path}")
@@ -527,6 +612,7 @@ class IntegratedEditorPanel(QWidget):
             self.autosave_manager.current_entry.metadata.path == deleted_path):
             self._create_new_entry()
     
+    @Slot(str)
     def _on_entry_restored(self, restored_path: str):
         """Handle entry restored."""
         logger.info(f"Entry restored: {restored_path}")
@@ -534,25 +620,9 @@ class IntegratedEditorPanel(QWidget):
     
     def setup_shortcuts(self):
         """Setup keyboard shortcuts."""
-        # Ctrl+N for new entry
-        new_shortcut = QShortcut(QKeySequence("Ctrl+N"), self)
-        new_shortcut.activated.connect(self.new_entry_requested.emit)
-        
-        # Ctrl+S for manual save
-        save_shortcut = QShortcut(QKeySequence("Ctrl+S"), self)
-        save_shortcut.activated.connect(self._manual_save)
-        
-        # Ctrl+K for search
-        search_shortcut = QShortcut(QKeySequence("Ctrl+K"), self)
-        search_shortcut.activated.connect(self.search_requested.emit)
-        
-        # F1 for help
-        help_shortcut = QShortcut(QKeySequence("F1"), self)
-        help_shortcut.activated.connect(self.help_requested.emit)
-        
-        # ESC to close
-        escape_shortcut = QShortcut(QKeySequence("Escape"), self)
-        escape_shortcut.activated.connect(self.collapse_requested.emit)
+        for key, target in _PANEL_SHORTCUTS:
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.activated.connect(getattr(self, target))
     
     def setup_connections(self):
         """Setup signal connections."""
@@ -562,8 +632,8 @@ class IntegratedEditorPanel(QWidget):
         self.top_bar.export_clicked.connect(self._on_export_clicked)
         self.top_bar.tags_clicked.connect(self._on_tags_clicked)
         self.top_bar.more_clicked.connect(self._on_more_clicked)
-        self.top_bar.settings_clicked.connect(self.settings_requested.emit)
-        self.top_bar.help_clicked.connect(self.help_requested.emit)
+        self.top_bar.settings_clicked.connect(self.settings_requested)
+        self.top_bar.help_clicked.connect(self.help_requested)
         
         # Connect search requested signal to our search handler
         self.search_requested.connect(self._on_search_clicked)
@@ -607,9 +677,9 @@ class IntegratedEditorPanel(QWidget):
         self.autosave_manager.save_completed.connect(self._on_save_completed)
         
         # Connect lifecycle signals to panel signals
-        self.lifecycle_manager.entry_created.connect(self.entry_created.emit)
-        self.lifecycle_manager.entry_updated.connect(self.entry_updated.emit)
-        self.lifecycle_manager.entry_saved.connect(self.entry_saved.emit)
+        self.lifecycle_manager.entry_created.connect(self.entry_created)
+        self.lifecycle_manager.entry_updated.connect(self.entry_updated)
+        self.lifecycle_manager.entry_saved.connect(self.entry_saved)
         self.lifecycle_manager.entry_saved.connect(self._update_save_time_display)
         
         # Connect panel signals to autosave actions
@@ -618,17 +688,21 @@ class IntegratedEditorPanel(QWidget):
         
         logger.debug("Autosave system initialized")
     
+    @Slot()
     def _on_text_changed(self):
         """Handle text changes - now managed by autosave system."""
-        content = self.text_editor.toPlainText()
-        self.content_changed.emit(content)
+        # No payload: listeners that need the text call get_content()
+        if not self._change_notify_timer.isActive():
+            self._change_notify_timer.start(_CHANGE_NOTIFY_MS)
         # Note: Autosave manager handles the actual saving logic
     
+    @Slot()
     def _on_save_started(self):
         """Handle autosave start."""
         self.status_bar.set_autosave_status(True)
         logger.debug("Autosave started")
     
+    @Slot(bool)
     def _on_save_completed(self, success: bool):
         """Handle autosave completion."""
         self.status_bar.set_autosave_status(False)
@@ -637,10 +711,12 @@ class IntegratedEditorPanel(QWidget):
         else:
             logger.warning("Autosave failed")
     
+    @Slot(str)
     def _update_save_time_display(self, save_time: str):
         """Update status bar with last save time."""
         self.status_bar.set_last_save_time(save_time)
     
+    @Slot(str, str)
     def _on_title_subtitle_changed(self, title: str, subtitle: str):
         """Handle title/subtitle changes from smart formatting."""
         # Update current entry metadata if available
@@ -650,16 +726,19 @@ class IntegratedEditorPanel(QWidget):
             entry.metadata.subtitle = subtitle
             logger.debug(f"Title/subtitle updated: '{title}' / '{subtitle}'")
     
+    @Slot(str, bool)
     def _on_formatting_rule_toggled(self, rule_name: str, enabled: bool):
         """Handle formatting rule toggle."""
         logger.info(f"Formatting rule '{rule_name}' {'enabled' if enabled else 'disabled'}")
     
+    @Slot()
     def _create_new_entry(self):
         """Create new entry via autosave manager."""
         if self.autosave_manager:
             self.autosave_manager.create_new_entry()
             logger.info("New entry created")
     
+    @Slot()
     def _manual_save(self):
         """Handle manual save via autosave manager."""
         self.save_requested.emit()
@@ -670,6 +749,7 @@ class IntegratedEditorPanel(QWidget):
             else:
                 logger.warning("Manual save failed")
     
+    @Slot()
     def _on_back_clicked(self):
         """Handle back button - show recent entries."""
         logger.info("Back/Recent clicked")
@@ -695,6 +775,7 @@ class IntegratedEditorPanel(QWidget):
         self._recent_popover.show()
         self._recent_popover.raise_()
     
+    @Slot()
     def _on_search_clicked(self):
         """Handle search button or Ctrl+K shortcut."""
         logger.info("Search clicked")
@@ -709,6 +790,7 @@ class IntegratedEditorPanel(QWidget):
         self._search_dialog.raise_()
         self._search_dialog.activateWindow()
         
+    @Slot(str)
     def _on_search_entry_selected(self, file_path: str):
         """Handle search entry selection."""
         logger.info(f"Loading entry from search: {file_path}")
@@ -716,16 +798,17 @@ class IntegratedEditorPanel(QWidget):
         # Load the selected entry
         if self.autosave_manager:
             try:
-                # Load the entry
-                entry_manager = self.autosave_manager.entry_manager
-                entry = entry_manager.load_entry(file_path)
+                # Load through the autosave manager: it saves the entry being
+                # replaced and doesn't treat the loaded text as a new edit.
+                # Repaints are held off while the text is set and formatted.
+                self.text_editor.setUpdatesEnabled(False)
+                try:
+                    loaded = self.autosave_manager.load_entry(file_path)
+                finally:
+                    self.text_editor.setUpdatesEnabled(True)
                 
-                if entry:
-                    # Set as current entry
-                    self.autosave_manager.current_entry = entry
-                    
-                    # Update editor content
-                    self.text_editor.setPlainText(entry.content)
+                if loaded:
+                    entry = self.autosave_manager.current_entry
                     
                     # Move cursor to end
                     cursor = self.text_editor.textCursor()
@@ -744,14 +827,17 @@ class IntegratedEditorPanel(QWidget):
                 QMessageBox.critical(self, "Error", 
                                    f"Error loading entry: {str(e)}")
     
+    @Slot()
     def _on_export_clicked(self):
         """Handle export button."""
         logger.info("Export clicked")
     
+    @Slot()
     def _on_tags_clicked(self):
         """Handle tags button."""
         logger.info("Tags clicked")
     
+    @Slot()
     def _on_more_clicked(self):
         """Handle more actions button - show entry actions menu."""
         logger.info("More actions clicked")
@@ -762,6 +848,8 @@ class IntegratedEditorPanel(QWidget):
                                   "No entry is currently loaded. Please create or open an entry first.")
             return
         
+        # Large entries aren't synced per keystroke; actions need the latest text
+        self.autosave_manager.sync_content()
         current_entry = self.autosave_manager.current_entry
         
         # Ensure entry has been saved (has a path)
@@ -788,8 +876,7 @@ class IntegratedEditorPanel(QWidget):
             return
         
         # Calculate target position based on corner
-        screen = QApplication.primaryScreen()
-        screen_geometry = screen.availableGeometry()
+        screen_geometry = self._available_geometry()
         
         if self.corner_position == "bottom_right":
             target_x = screen_geometry.right() - self.target_width - 20
@@ -811,17 +898,26 @@ class IntegratedEditorPanel(QWidget):
         self.setGeometry(start_rect)
         self.show()
         
-        # Create expand animation
-        self.expand_animation = QPropertyAnimation(self, b"geometry")
-        self.expand_animation.setDuration(300)
+        # Run expand animation
         self.expand_animation.setStartValue(start_rect)
         self.expand_animation.setEndValue(target_rect)
-        self.expand_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self.expand_animation.finished.connect(self._on_expand_finished)
-        
         self.expand_animation.start()
         logger.debug("Panel expand animation started")
     
+    def _available_geometry(self) -> QRect:
+        """Return the primary screen's available geometry, cached."""
+        if self._screen_geometry is None:
+            screen = QApplication.primaryScreen()
+            if screen is not self._watched_screen:
+                screen.availableGeometryChanged.connect(self._invalidate_screen_geometry)
+                self._watched_screen = screen
+            self._screen_geometry = screen.availableGeometry()
+        return self._screen_geometry
+    
+    def _invalidate_screen_geometry(self, *args):
+        """Drop the cached geometry when screens or the taskbar change."""
+        self._screen_geometry = None
+    
     def collapse_to_position(self, target_pos, target_size):
         """Collapse the panel to a given position."""
         if not self.is_expanded:
@@ -830,23 +926,20 @@ class IntegratedEditorPanel(QWidget):
         current_rect = self.geometry()
         target_rect = QRect(target_pos.x(), target_pos.y(), target_size.width(), target_size.height())
         
-        # Create collapse animation
-        self.collapse_animation = QPropertyAnimation(self, b"geometry")
-        self.collapse_animation.setDuration(300)
+        # Run collapse animation
         self.collapse_animation.setStartValue(current_rect)
         self.collapse_animation.setEndValue(target_rect)
-        self.collapse_animation.setEasingCurve(QEasingCurve.Type.InCubic)
-        self.collapse_animation.finished.connect(self._on_collapse_finished)
-        
         self.collapse_animation.start()
         logger.debug("Panel collapse animation started")
     
+    @Slot()
     def _on_expand_finished(self):
         """Handle expand animation completion."""
         self.is_expanded = True
         self._focus_editor()
         logger.debug("Panel expand completed")
     
+    @Slot()
     def _on_collapse_finished(self):
         """Handle collapse animation completion."""
         self.is_expanded = False
@@ -873,9 +966,9 @@ class IntegratedEditorPanel(QWidget):
         self.text_editor.clear()
     
     def save_content(self):
-        """Save current content (trigger autosave)."""
+        """Save current content if it changed since the last save."""
         if self.autosave_manager:
-            self.autosave_manager.force_save()
+            self.autosave_manager.save_and_close()
     
     def save_settings(self):
         """Save panel settings."""
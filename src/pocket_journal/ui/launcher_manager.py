@@ -68,12 +68,17 @@ class LauncherManager(QObject):
         else:
             self.setup_corner_mode()
         
-        # Create editor panel (always needed regardless of dock mode)
-        self.editor_panel = IntegratedEditorPanel()
-        self.editor_panel.collapse_requested.connect(self.collapse_panel)
+        # The editor panel is built on the first expand (see _ensure_editor_panel)
         
         logger.debug(f"Launcher components setup for {dock_mode} mode")
     
+    def _ensure_editor_panel(self) -> IntegratedEditorPanel:
+        """Create the editor panel the first time it is needed."""
+        if self.editor_panel is None:
+            self.editor_panel = IntegratedEditorPanel()
+            self.editor_panel.collapse_requested.connect(self.collapse_panel)
+        return self.editor_panel
+    
     def setup_corner_mode(self):
         """Setup for corner launcher mode."""
         # Create circular launcher
@@ -175,13 +180,12 @@ class LauncherManager(QObject):
                 self.editor_panel.activateWindow()
             return
         
-        if not self.editor_panel:
-            return
-        
         if self.current_dock_mode == "corner":
             # Expand from launcher position
             if not self.circular_launcher:
                 return
+            
+            self._ensure_editor_panel()
                 
             # Get launcher position and size
             launcher_pos = self.circular_launcher.pos()
@@ -194,6 +198,8 @@ class LauncherManager(QObject):
             self.hide_launcher()
             self.editor_panel.expand_from_position(launcher_pos, launcher_size)
         else:
+            self._ensure_editor_panel()
+            
             # Tray mode - expand from screen center or corner
             from PySide6.QtWidgets import QApplication
             screen = QApplication.primaryScreen()
@@ -11,6 +11,7 @@ import logging
 import re
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
@@ -34,6 +35,15 @@ from ..settings import get_setting
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _entry_item_fonts():
+    """Create the entry item fonts once; QFont needs a QApplication, so not at import."""
+    return (
+        QFont("Segoe UI", 9, QFont.Weight.Bold),  # Title
+        QFont("Segoe UI", 8),                     # Timestamp and word count
+    )
+
+
 class RecentEntryItem(QWidget):
     """Individual recent entry item widget."""
     
@@ -56,8 +66,9 @@ class RecentEntryItem(QWidget):
         if not title.strip():
             title = 'Untitled'
         
+        title_font, detail_font = _entry_item_fonts()
         title_label = QLabel(title)
-        title_label.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
+        title_label.setFont(title_font)
         title_label.setStyleSheet("color: #333; background: transparent;")
         title_label.setWordWrap(True)
         layout.addWidget(title_label)
@@ -75,7 +86,7 @@ class RecentEntryItem(QWidget):
             time_str = "Unknown time"
             
         time_label = QLabel(time_str)
-        time_label.setFont(QFont("Segoe UI", 8))
+        time_label.setFont(detail_font)
         time_label.setStyleSheet("color: #666; background: transparent;")
         layout.addWidget(time_label)
         
@@ -83,7 +94,7 @@ class RecentEntryItem(QWidget):
         word_count = self.entry_info.get('word_count', 0)
         if word_count > 0:
             count_label = QLabel(f"{word_count} words")
-            count_label.setFont(QFont("Segoe UI", 8))
+            count_label.setFont(detail_font)
             count_label.setStyleSheet("color: #888; background: transparent;")
             layout.addWidget(count_label)
         
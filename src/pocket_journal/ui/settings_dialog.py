@@ -518,6 +518,11 @@ class SettingsDialog(QDialog):
         self.copy_diagnostics_btn.setToolTip("Copy diagnostic information to clipboard")
         diag_buttons_layout.addWidget(self.copy_diagnostics_btn)
         
+        # One timer restores the button label; repeated copies just restart it
+        self._copy_status_timer = QTimer(self)
+        self._copy_status_timer.setSingleShot(True)
+        self._copy_status_timer.timeout.connect(self._reset_copy_diagnostics_text)
+        
         self.save_diagnostics_btn = QPushButton("Save to File...")
         self.save_diagnostics_btn.setToolTip("Save diagnostic information to a file")
         diag_buttons_layout.addWidget(self.save_diagnostics_btn)
@@ -1068,9 +1073,12 @@ System Tray: {"Available" if hasattr(self, 'tray_radio') and self.tray_radio.isE
         clipboard.setText(self.diagnostics_text.toPlainText())
         
         # Show temporary status
-        old_text = self.copy_diagnostics_btn.text()
         self.copy_diagnostics_btn.setText("Copied!")
-        QTimer.singleShot(2000, lambda: self.copy_diagnostics_btn.setText(old_text))
+        self._copy_status_timer.start(2000)
+    
+    def _reset_copy_diagnostics_text(self):
+        """Restore the copy button label after the "Copied!" status."""
+        self.copy_diagnostics_btn.setText("Copy to Clipboard")
     
     def save_diagnostics(self):
         """Save diagnostics to file."""
@@ -16,6 +16,14 @@ def ensure_directory_exists(path: Union[str, Path]) -> Path:
     return path_obj
 
 
+def write_text_atomic(path: Union[str, Path], text: str, encoding: str = 'utf-8') -> None:
+    """Write text via a temp file and rename, so readers never see a partial file."""
+    path_obj = Path(path)
+    tmp_path = path_obj.with_name(path_obj.name + ".tmp")
+    tmp_path.write_text(text, encoding=encoding)
+    os.replace(tmp_path, path_obj)
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for cross-platform compatibility."""
     # Remove or replace invalid characters
@@ -133,6 +133,16 @@ class TestSettingsManager:
         # Reset specific setting
         settings_manager.reset("theme")
         assert settings_manager.get("theme") == DEFAULT_SETTINGS["theme"]
+
+    def test_flush_writes_pending_changes(self):
+        """Test that debounced changes are written by flush()."""
+        settings_manager = SettingsManager()
+
+        settings_manager.set("test_key", "flushed_value")
+        assert settings_manager.flush()
+
+        with open(settings_manager.settings_file, 'r', encoding='utf-8') as f:
+            assert json.load(f)["test_key"] == "flushed_value"
     
     def test_convenience_functions(self):
         """Test convenience functions work correctly."""
@@ -157,6 +167,7 @@ class TestSettingsManager:
         assert isinstance(settings_manager.get_journal_directory(), Path)
         assert isinstance(settings_manager.get_backup_directory(), Path)
         assert isinstance(settings_manager.get_log_directory(), Path)
+        assert settings_manager.log_dir == settings_manager.get_log_directory()
 
 
 class TestSettingsIntegration:
@@ -136,9 +136,14 @@ class TestCompactStatusBar:
         # Check fixed height
         assert status_bar.height() == 18
         
-        # Check timer is running
+        # Check timer only runs while the bar is visible, waking once a minute
+        assert not status_bar.timer.isActive()
+        status_bar.show()
         assert status_bar.timer.isActive()
-        assert status_bar.timer.interval() == 30000  # 30 seconds
+        assert status_bar.timer.isSingleShot()
+        assert 0 < status_bar.timer.interval() <= 60000
+        status_bar.hide()
+        assert not status_bar.timer.isActive()
     
     def test_autosave_status(self, app):
         """Test autosave status indicator."""
@@ -482,7 +487,10 @@ class TestStep5AcceptanceCriteria:
         panel.content_changed.connect(content_changed_signal)
         
         panel.text_editor.setPlainText("New content")
-        content_changed_signal.assert_called_with("New content")
+        panel.text_editor.setPlainText("Newer content")
+        QTest.qWait(300)
+        content_changed_signal.assert_called_once_with()
+        assert panel.get_content() == "Newer content"
     
     def test_minimalist_design_elements(self, app):
         """Test minimalist design elements."""
@@ -497,8 +505,9 @@ class TestStep5AcceptanceCriteria:
         # Icons should be small (24px)
         assert panel.top_bar.back_btn.size().width() == 24
         
-        # Text editor should have subtle padding (checked via stylesheet)
-        assert "padding: 8px" in panel.text_editor.styleSheet()
+        # Text editor should have subtle padding (from the shared stylesheet)
+        assert panel.text_editor.objectName() == "panelEditor"
+        assert "padding: 8px" in QApplication.instance().styleSheet()
         
         # Placeholder text should be present
         assert panel.text_editor.placeholderText() == "Start typing…"
\ No newline at end of file
@@ -3,6 +3,7 @@ Basic tests for PocketJournal application.
 """
 
 import pytest
+import sys
 from PySide6.QtWidgets import QApplication
 from pocket_journal.main import PocketJournalMainWindow, PocketJournalApp
 
@@ -40,4 +41,29 @@ def test_window_has_central_widget(qtbot, app):
     qtbot.addWidget(window)
     
     central_widget = window.centralWidget()
-    assert central_widget is not None
\ No newline at end of file
+    assert central_widget is not None
+
+
+def test_minimize_on_expand_is_cached(qtbot, app, monkeypatch):
+    """Test that the panel-expand setting is cached and refreshed on demand."""
+    # pocket_journal.main is shadowed by the package's main() function
+    main_module = sys.modules[PocketJournalMainWindow.__module__]
+    
+    overrides = {"minimize_main_when_panel_open": False}
+    real_get_setting = main_module.get_setting
+    
+    def fake_get_setting(key, default=None):
+        if key in overrides:
+            return overrides[key]
+        return real_get_setting(key, default)
+    
+    # Keep the user's real settings file out of this test
+    monkeypatch.setattr(main_module, "get_setting", fake_get_setting)
+    window = PocketJournalMainWindow()
+    qtbot.addWidget(window)
+    
+    overrides["minimize_main_when_panel_open"] = True
+    assert window._minimize_on_expand is False
+    
+    window.refresh_cached_settings()
+    assert window._minimize_on_expand is True
@@ -0,0 +1,320 @@
+"""
+Tests for the file system scanner.
+
+The scanner persists through pocket_journal.data.database, which is not part
+of this tree, so the scan fixture imports the scanner against an in-memory
+stand-in and restores sys.modules once this module's tests are done.
+"""
+
+import hashlib
+import importlib
+import os
+import sys
+import time
+import types
+
+import pytest
+from PIL import Image
+
+
+class _FileRecord:
+    """Minimal stand-in for database.FileRecord."""
+    
+    def __init__(self, path_hash, file_type, size_bytes, mtime):
+        self.path_hash = path_hash
+        self.file_type = file_type
+        self.size_bytes = size_bytes
+        self.mtime = mtime
+        self.data = {}
+    
+    @classmethod
+    def from_file_path(cls, path, scan_time):
+        stat_result = path.stat()
+        path_hash = hashlib.sha256(str(path.resolve()).encode()).hexdigest()
+        return cls(path_hash, path.suffix.lower(), stat_result.st_size, stat_result.st_mtime)
+
+
+class _FilesTable:
+    """In-memory stand-in for database.FilesTable."""
+    
+    def __init__(self, rows):
+        self.rows = rows
+    
+    def get_by_path_hash(self, path_hash):
+        return self.rows.get(path_hash)
+    
+    def upsert_file(self, file_record):
+        existed = file_record.path_hash in self.rows
+        self.rows[file_record.path_hash] = file_record
+        return existed
+    
+    def update_last_seen(self, path_hash, seen_at):
+        pass
+    
+    def cleanup_missing_files(self, found_hashes):
+        missing = set(self.rows) - set(found_hashes)
+        for path_hash in missing:
+            del self.rows[path_hash]
+        return len(missing)
+
+
+_database = types.SimpleNamespace(files_table={})
+
+
+@pytest.fixture(scope="module")
+def scan():
+    """Import the scanner against an in-memory database, restoring sys.modules after."""
+    database_module = types.ModuleType("pocket_journal.data.database")
+    database_module.FileRecord = _FileRecord
+    database_module.FilesTable = _FilesTable
+    database_module.get_database = lambda: _database
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "pocket_journal.data.database", database_module)
+        # Record (and then drop) any scanner module already imported, so
+        # undoing restores it, or removes the one imported here
+        mp.setitem(sys.modules, "pocket_journal.ops.scan", None)
+        mp.delitem(sys.modules, "pocket_journal.ops.scan")
+        # Importing the submodule sets it on the package; undo that too
+        ops = importlib.import_module("pocket_journal.ops")
+        mp.setattr(ops, "scan", None, raising=False)
+        yield importlib.import_module("pocket_journal.ops.scan")
+
+
+@pytest.fixture(autouse=True)
+def empty_database():
+    """Start every test with an empty files table."""
+    _database.files_table.clear()
+    yield _database.files_table
+    _database.files_table.clear()
+
+
+def _write(path, text="content"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def _scanner(scan, **overrides):
+    config = scan.ScanConfig()
+    config.check_image_dimensions = False
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return scan.FileSystemScanner(config)
+
+
+class TestScanRules:
+    """Test include/exclude rule semantics."""
+    
+    def test_exclude_wins_over_include(self, scan):
+        config = scan.ScanConfig()
+        config.add_rule("*.bak", "include")
+        config.add_rule("*/notes/*", "include")
+        
+        assert not config.should_include_path("/home/user/notes/draft.bak")
+        assert not config.should_include_path("/home/user/notes/.git/config")
+    
+    def test_file_matching_no_include_rule_is_skipped(self, scan):
+        config = scan.ScanConfig()
+        
+        assert config.should_include_path("/home/user/notes/today.md")
+        assert config.should_include_path("/home/user/photo.JPG")
+        assert not config.should_include_path("/home/user/archive.zip")
+        assert not config.should_include_path("/home/user/Makefile")
+    
+    def test_include_glob_rule(self, scan):
+        config = scan.ScanConfig()
+        config.add_rule("*/notes/*", "include")
+        
+        assert config.should_include_path("/home/user/notes/archive.zip")
+        assert not config.should_include_path("/home/user/other/archive.zip")
+    
+    def test_no_include_rules_includes_everything_not_excluded(self, scan):
+        config = scan.ScanConfig()
+        config.rules = [scan.ScanRule("*.tmp", "exclude"), scan.ScanRule("*/cache/*", "exclude")]
+        config._index_rules()
+        
+        assert config.should_include_path("/home/user/archive.zip")
+        assert config.should_include_path("/home/user/Makefile")
+        assert not config.should_include_path("/home/user/scratch.tmp")
+        assert not config.should_include_path("/home/user/cache/data.bin")
+    
+    def test_case_sensitive_rule(self, scan):
+        config = scan.ScanConfig()
+        config.rules = [scan.ScanRule("*.Log", "include", case_sensitive=True)]
+        config._index_rules()
+        
+        assert config.should_include_path("/var/app.Log")
+        assert not config.should_include_path("/var/app.txt")
+    
+    def test_excluded_dirs(self, scan):
+        config = scan.ScanConfig()
+        
+        assert config.is_excluded_dir("node_modules")
+        assert config.is_excluded_dir(".git")
+        assert not config.is_excluded_dir("notes")
+
+
+class TestReadImageDims:
+    """Test header-only image dimension parsing against PIL output."""
+    
+    @pytest.mark.parametrize("suffix, save_kwargs", [
+        (".png", {}),
+        (".gif", {}),
+        (".bmp", {}),
+        (".jpg", {}),
+        (".jpg", {"progressive": True}),
+    ])
+    def test_common_formats(self, scan, tmp_path, suffix, save_kwargs):
+        path = tmp_path / f"image{suffix}"
+        Image.new("RGB", (321, 123), "red").save(path, **save_kwargs)
+        
+        assert scan._read_image_dims(path) == (321, 123)
+    
+    @pytest.mark.parametrize("mode, save_kwargs, chunk", [
+        ("RGB", {}, b"VP8 "),
+        ("RGB", {"lossless": True}, b"VP8L"),
+        ("RGBA", {}, b"VP8X"),
+    ])
+    def test_webp(self, scan, tmp_path, mode, save_kwargs, chunk):
+        path = tmp_path / "image.webp"
+        Image.new(mode, (321, 123)).save(path, **save_kwargs)
+        assert path.read_bytes()[12:16] == chunk
+        
+        assert scan._read_image_dims(path) == (321, 123)
+    
+    def test_unrecognised_or_truncated(self, scan, tmp_path):
+        text = _write(tmp_path / "notes.txt", "not an image, just some text")
+        short = tmp_path / "short.png"
+        short.write_bytes(b"\x89PNG")
+        
+        assert scan._read_image_dims(text) is None
+        assert scan._read_image_dims(short) is None
+    
+    def test_small_images_are_skipped(self, scan, tmp_path):
+        Image.new("RGB", (300, 300)).save(tmp_path / "large.png")
+        Image.new("RGB", (32, 32)).save(tmp_path / "small.png")
+        
+        result = _scanner(scan, check_image_dimensions=True).scan_path(tmp_path)
+        
+        assert result.files_new == 1
+        assert result.files_skipped == 1
+
+
+class TestFileSystemScanner:
+    """Test scanning, rescanning and the scanner's caches."""
+    
+    def test_scan_and_rescan(self, scan, tmp_path, empty_database):
+        _write(tmp_path / "a.md")
+        _write(tmp_path / "sub" / "b.txt")
+        _write(tmp_path / "skip.zip")
+        scanner = _scanner(scan)
+        
+        first = scanner.scan_path(tmp_path)
+        assert first.files_new == 2
+        assert first.files_skipped == 1
+        assert len(empty_database) == 2
+        
+        second = scanner.scan_path(tmp_path)
+        assert second.files_new == 0
+        assert second.files_updated == 0
+        assert second.files_unchanged == 2
+    
+    def test_rescan_detects_changes(self, scan, tmp_path):
+        target = _write(tmp_path / "a.md")
+        scanner = _scanner(scan)
+        scanner.scan_path(tmp_path)
+        
+        target.write_text("longer content than before")
+        result = scanner.scan_path(tmp_path)
+        
+        assert result.files_updated == 1
+        assert result.files_unchanged == 0
+    
+    def test_removed_file_is_cleaned_up(self, scan, tmp_path, empty_database):
+        _write(tmp_path / "a.md")
+        gone = _write(tmp_path / "b.md")
+        scanner = _scanner(scan)
+        scanner.scan_path(tmp_path)
+        
+        gone.unlink()
+        result = scanner.scan_path(tmp_path)
+        
+        assert result.files_unchanged == 1
+        assert len(empty_database) == 1
+    
+    def test_file_reached_twice_counts_once(self, scan, tmp_path, empty_database):
+        target = _write(tmp_path / "a.md")
+        _write(tmp_path / "b.md")
+        
+        result = _scanner(scan).scan_paths([target, tmp_path])
+        
+        assert result.files_new == 2
+        assert result.files_updated == 0
+        assert len(empty_database) == 2
+    
+    def test_known_file_cleaned_up_elsewhere_is_reinserted(self, scan, tmp_path, empty_database):
+        target = _write(tmp_path / "one" / "a.md")
+        _write(tmp_path / "two" / "b.md")
+        first, second = _scanner(scan), _scanner(scan)
+        first.scan_path(tmp_path / "one")
+        
+        # The other scanner's cleanup drops rows it did not see
+        second.scan_path(tmp_path / "two")
+        assert len(empty_database) == 1
+        
+        result = first.scan_path(tmp_path / "one")
+        
+        assert result.files_new == 1
+        assert result.files_unchanged == 0
+        record = _FileRecord.from_file_path(target, None)
+        assert record.path_hash in empty_database
+    
+    def test_file_added_in_same_mtime_tick_is_found(self, scan, tmp_path):
+        _write(tmp_path / "a.md")
+        scanner = _scanner(scan)
+        scanner.scan_path(tmp_path)
+        
+        # Likely lands within the directory's mtime granularity, so the
+        # cached listing must not be trusted
+        _write(tmp_path / "b.md")
+        result = scanner.scan_path(tmp_path)
+        
+        assert result.files_new == 1
+        assert result.files_unchanged == 1
+    
+    def test_cached_listing_reused_for_old_directory(self, scan, tmp_path):
+        _write(tmp_path / "a.md")
+        old = time.time() - 60
+        os.utime(tmp_path, (old, old))
+        scanner = _scanner(scan)
+        scanner.scan_path(tmp_path)
+        assert str(tmp_path) in scanner._dir_listings
+        
+        result = scanner.scan_path(tmp_path)
+        
+        assert result.files_unchanged == 1
+        assert result.files_new == 0
+    
+    def test_scan_time_limit(self, scan, tmp_path, empty_database):
+        for i in range(5):
+            _write(tmp_path / f"note{i}.md")
+        scanner = _scanner(scan)
+        scanner.scan_path(tmp_path)
+        
+        scanner.config.max_scan_time = 0
+        empty_database.clear()
+        _write(tmp_path / "extra.md")
+        result = scanner.scan_path(tmp_path)
+        
+        assert scan._SCAN_TIME_LIMIT_WARNING in result.warnings
+        assert result.warnings.count(scan._SCAN_TIME_LIMIT_WARNING) == 1
+        assert result.files_new < 6
+        # An unfinished scan must not drop rows for files it never reached
+        assert not any("Removed" in warning for warning in result.warnings)
+    
+    def test_missing_path_warns(self, scan, tmp_path):
+        result = _scanner(scan).scan_path(tmp_path / "missing")
+        
+        assert result.files_found == 0
+        assert any("does not exist" in warning for warning in result.warnings)
@@ -70,9 +70,9 @@ class TestAboutDialog:
         assert hasattr(dialog, 'changelog_text')
         assert dialog.changelog_text is not None
         
-        # Changelog should have content (either loaded or placeholder)
-        content = dialog.changelog_text.toHtml()
-        assert len(content) > 0
+        # Changelog is loaded once the dialog has been shown
+        dialog.show()
+        qtbot.waitUntil(lambda: len(dialog.changelog_text.text()) > 0)
     
     @patch('pocket_journal.ui.about_dialog.QDesktopServices.openUrl')
     def test_open_data_directory(self, mock_open_url, qtbot):
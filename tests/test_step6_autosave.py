@@ -2,8 +2,11 @@
 Tests for Step 6 autosave and entry lifecycle functionality.
 """
 
+import gc
 import pytest
 import tempfile
+import threading
+import time
 import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -27,6 +30,18 @@ def app():
     yield app
 
 
+@pytest.fixture(autouse=True)
+def collect_qt_garbage():
+    """Free each test's editors and managers before the next test runs.
+    
+    The focus-out wrapper ties the editor and its AutosaveManager into a
+    reference cycle; left to the cyclic collector, they are freed at an
+    arbitrary point in a later test, which can crash inside Qt.
+    """
+    yield
+    gc.collect()
+
+
 @pytest.fixture
 def temp_entries_dir():
     """Create temporary directory for entry storage."""
@@ -268,7 +283,13 @@ class TestAutosaveManager:
             # Timer should be started
             assert autosave_manager.debounce_timer.isActive()
             
-            # Trigger timer
+            # Firing before the deadline only re-arms the timer
+            autosave_manager.debounce_timer.timeout.emit()
+            autosave_manager._save_current_entry.assert_not_called()
+            assert autosave_manager.debounce_timer.isActive()
+            
+            # Trigger timer once the debounce interval has passed
+            autosave_manager._save_deadline = 0.0
             autosave_manager.debounce_timer.timeout.emit()
             
             # Should call save
@@ -311,6 +332,72 @@ class TestAutosaveManager:
             autosave_manager._perform_immediate_save.assert_called_once()
             # Should create new entry
             mock_manager.create_new_entry.assert_called_once_with("New content")
+    
+    def test_switching_entries_during_background_write(self, app, temp_entries_dir):
+        """Test edits made while an autosave is being written survive an entry switch."""
+        from src.pocket_journal.utils.file_utils import write_text_atomic
+        
+        def slow_write(path, text, encoding='utf-8'):
+            time.sleep(0.2)
+            write_text_atomic(path, text, encoding)
+        
+        text_editor = QTextEdit()
+        
+        with patch('src.pocket_journal.data.entry_manager.EntryManager._get_base_path', return_value=temp_entries_dir), \
+             patch('src.pocket_journal.core.autosave.write_text_atomic', side_effect=slow_write):
+            autosave_manager = AutosaveManager(text_editor)
+            
+            # Start an autosave, then keep typing while it is written
+            text_editor.setPlainText("First draft")
+            autosave_manager._save_current_entry()
+            assert autosave_manager.is_saving
+            text_editor.setPlainText("First draft, continued")
+            
+            old_entry = autosave_manager.current_entry
+            autosave_manager.create_new_entry("")
+            autosave_manager._finish_pending_write()
+            
+            # The later text reached disk and the old entry is clean
+            assert not old_entry.is_modified
+            content = Path(old_entry.metadata.path).read_text(encoding='utf-8')
+            assert "First draft, continued" in content
+    
+    def test_large_document_edit_during_background_write(self, app, temp_entries_dir):
+        """Test edits to a large document made during a write are still autosaved."""
+        from src.pocket_journal.core.autosave import _LIVE_SYNC_CHAR_LIMIT
+        from src.pocket_journal.utils.file_utils import write_text_atomic
+        
+        write_allowed = threading.Event()
+        
+        def gated_write(path, text, encoding='utf-8'):
+            write_allowed.wait(5)
+            write_text_atomic(path, text, encoding)
+        
+        text_editor = QTextEdit()
+        large_text = "word " * (_LIVE_SYNC_CHAR_LIMIT // 5 + 2000)
+        
+        with patch('src.pocket_journal.data.entry_manager.EntryManager._get_base_path', return_value=temp_entries_dir), \
+             patch('src.pocket_journal.core.autosave.write_text_atomic', side_effect=gated_write):
+            autosave_manager = AutosaveManager(text_editor)
+            
+            # Start an autosave, then keep typing while it is written
+            text_editor.setPlainText(large_text)
+            autosave_manager._save_current_entry()
+            assert autosave_manager.is_saving
+            text_editor.append("LATER")
+            
+            write_allowed.set()
+            autosave_manager._finish_pending_write()
+            
+            # The later edit is still pending and the next autosave writes it
+            assert autosave_manager.has_unsaved_changes
+            autosave_manager._perform_autosave()
+            autosave_manager._finish_pending_write()
+            
+            entry = autosave_manager.current_entry
+            content = Path(entry.metadata.path).read_text(encoding='utf-8')
+            assert "LATER" in content
+            assert not autosave_manager.has_unsaved_changes
 
 
 class TestEntryLifecycleManager: